@@ -17,6 +17,14 @@ from .xp_calculator import XPCalculator
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Machine-readable codes reported in the 'warning_codes' list of
+# delete_task() and check_deletion_safety() results.
+WARNING_COMPLETED_TASK = 'COMPLETED_TASK'
+WARNING_ACTIVE_TASK = 'ACTIVE_TASK'
+WARNING_HIGH_PRIORITY = 'HIGH_PRIORITY'
+WARNING_HIGH_XP = 'HIGH_XP'  # check_deletion_safety() only
+WARNING_BACKUP_FAILED = 'BACKUP_FAILED'  # delete_task() only
+
 
 class TaskManagerError(Exception):
     """Base exception for task manager operations."""
@@ -411,7 +419,8 @@ class TaskManager:
             force: Force deletion even for completed tasks
             
         Returns:
-            dict: Deletion result with warnings and task info
+            dict: Deletion result with warnings, a 'warning_codes' list of
+                the matching WARNING_* codes in the same order, and task info
             
         Raises:
             TaskNotFoundError: If task doesn't exist
@@ -435,11 +444,13 @@ class TaskManager:
                     'completed_at': task.completed_at.isoformat() if task.completed_at else None
                 },
                 'warnings': [],
+                'warning_codes': [],
                 'requires_confirmation': False
             }
             
             # Safety checks and warnings
             if task.is_completed:
+                result['warning_codes'].append(WARNING_COMPLETED_TASK)
                 if not force:
                     result['requires_confirmation'] = True
                     result['warnings'].append(
@@ -457,12 +468,14 @@ class TaskManager:
             
             # Additional warnings for active tasks
             if task.status == TaskStatus.ACTIVE:
+                result['warning_codes'].append(WARNING_ACTIVE_TASK)
                 result['warnings'].append(
                     f"Deleting active task '{task.title}' - consider marking as blocked or pending instead."
                 )
             
             # High priority task warning
             if task.priority in [TaskPriority.HIGH, TaskPriority.CRITICAL]:
+                result['warning_codes'].append(WARNING_HIGH_PRIORITY)
                 result['warnings'].append(
                     f"Deleting {task.priority.name.lower()} priority task '{task.title}' - ensure this is intentional."
                 )
@@ -473,6 +486,7 @@ class TaskManager:
                 logger.debug("Created backup before task deletion")
             except Exception as e:
                 logger.warning(f"Failed to create backup before deletion: {e}")
+                result['warning_codes'].append(WARNING_BACKUP_FAILED)
                 result['warnings'].append("Could not create backup before deletion")
             
             # Remove task
@@ -596,7 +610,9 @@ class TaskManager:
             task_id: Task identifier
             
         Returns:
-            dict: Safety check results with warnings and confirmation requirements
+            dict: Safety check results with warnings, a 'warning_codes' list
+                of the matching WARNING_* codes in the same order, and
+                confirmation requirements
             
         Raises:
             TaskNotFoundError: If task doesn't exist
@@ -607,6 +623,7 @@ class TaskManager:
             result = {
                 'requires_confirmation': False,
                 'warnings': [],
+                'warning_codes': [],
                 'safety_level': 'safe',  # safe, caution, danger
                 'task_info': {
                     'title': task.title,
@@ -622,6 +639,7 @@ class TaskManager:
             if task.is_completed:
                 result['requires_confirmation'] = True
                 result['safety_level'] = 'danger'
+                result['warning_codes'].append(WARNING_COMPLETED_TASK)
                 result['warnings'].append(
                     f"This completed task has awarded {task.xp_reward} XP. "
                     "Deletion will not affect your earned XP but will remove the task from history."
@@ -631,6 +649,7 @@ class TaskManager:
             elif task.status == TaskStatus.ACTIVE:
                 result['requires_confirmation'] = True
                 result['safety_level'] = 'caution'
+                result['warning_codes'].append(WARNING_ACTIVE_TASK)
                 result['warnings'].append(
                     "This task is currently active. Consider marking it as blocked or pending instead."
                 )
@@ -640,6 +659,7 @@ class TaskManager:
                 result['requires_confirmation'] = True
                 if result['safety_level'] == 'safe':
                     result['safety_level'] = 'caution'
+                result['warning_codes'].append(WARNING_HIGH_PRIORITY)
                 result['warnings'].append(
                     f"This is a {task.priority.name.lower()} priority task. Ensure deletion is intentional."
                 )
@@ -648,6 +668,7 @@ class TaskManager:
             if task.xp_reward >= 50:  # Hard tasks
                 if result['safety_level'] == 'safe':
                     result['safety_level'] = 'caution'
+                result['warning_codes'].append(WARNING_HIGH_XP)
                 result['warnings'].append(
                     f"This task has a high XP value ({task.xp_reward} XP). Consider completing it instead."
                 )
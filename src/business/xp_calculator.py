@@ -1,13 +1,29 @@
 """XP calculation logic with difficulty-based rewards and bonus systems."""
 
-from typing import Optional
-from datetime import datetime, timedelta
+import math
+from bisect import bisect_right
+from typing import List, Optional
+from datetime import date
 
-from ..models.enums import TaskDifficulty
+from ..models.enums import TaskDifficulty, TaskPriority
 from ..models.task import Task
 from ..models.player import PlayerData
 
 
+# Levels covered by the precomputed threshold table; higher levels fall back to the formula.
+MAX_LEVEL = 100
+
+# Total XP at which each level starts; index 0 is level 1.
+_LEVEL_THRESHOLDS = tuple(100 * (level - 1) ** 2 for level in range(1, MAX_LEVEL + 1))
+
+# Streak lengths covered by the precomputed streak multiplier table.
+_STREAK_TABLE_SIZE = 33
+
+# Multipliers are applied as integer percentages (110 = 1.1x) so XP math stays
+# exact; the product of two of them is scaled by this much.
+_PERCENT_PRODUCT_SCALE = 100 * 100
+
+
 class XPCalculator:
     """XP calculation with difficulty-based rewards and bonus logic."""
     
@@ -18,6 +34,8 @@ class XPCalculator:
     
     DAILY_COMPLETION_BONUS = 5  # Flat bonus for completing tasks same day
     WEEKLY_COMPLETION_BONUS = 10  # Flat bonus for completing multiple tasks in a week
+    WEEKLY_STREAK_THRESHOLD = 2  # Minimum streak for the weekly bonus
+    WEEKLY_WINDOW_DAYS = 7  # Days since last activity that still count as this week
     
     # Priority multipliers
     PRIORITY_MULTIPLIERS = {
@@ -49,8 +67,7 @@ class XPCalculator:
         Returns:
             float: Priority multiplier (1.0 = no bonus)
         """
-        priority_name = task.priority.name
-        return cls.PRIORITY_MULTIPLIERS.get(priority_name, 1.0)
+        return _priority_percent(task.priority) / 100
     
     @classmethod
     def calculate_streak_bonus(cls, player: PlayerData) -> float:
@@ -62,14 +79,16 @@ class XPCalculator:
         Returns:
             float: Streak multiplier (1.0 = no bonus)
         """
-        if player.current_streak < cls.STREAK_BONUS_THRESHOLD:
-            return 1.0
-        
-        # Calculate bonus based on streak length
-        streak_levels = player.current_streak - cls.STREAK_BONUS_THRESHOLD + 1
-        bonus = min(streak_levels * cls.STREAK_BONUS_MULTIPLIER, cls.MAX_STREAK_BONUS)
+        return _streak_percent(player.current_streak) / 100
+    
+    @staticmethod
+    def _multiplier(task: Task, player: PlayerData) -> int:
+        """Return the combined priority and streak multiplier.
         
-        return 1.0 + bonus
+        The result is the product of the two percentages, so it is scaled by
+        _PERCENT_PRODUCT_SCALE (13200 = 1.32x).
+        """
+        return _priority_percent(task.priority) * _streak_percent(player.current_streak)
     
     @classmethod
     def calculate_completion_bonus(cls, task: Task, player: PlayerData) -> int:
@@ -83,20 +102,35 @@ class XPCalculator:
             int: Flat bonus XP amount
         """
         bonus = 0
-        now = datetime.now()
+        today = date.today().toordinal()
         
         # Daily completion bonus - if task was created and completed same day
-        if (task.created_at.date() == now.date()):
+        if task.created_at.toordinal() == today:
             bonus += cls.DAILY_COMPLETION_BONUS
         
         # Weekly completion bonus - if player has completed multiple tasks this week
-        if player.last_activity:
-            days_since_last = (now - player.last_activity).days
-            if days_since_last <= 7 and player.current_streak >= 2:
-                bonus += cls.WEEKLY_COMPLETION_BONUS
+        bonus += cls._weekly_bonus(player, today)
         
         return bonus
     
+    @classmethod
+    def _weekly_bonus(cls, player: PlayerData, today: int) -> int:
+        """Return the weekly completion bonus for a player.
+        
+        Args:
+            player: Player data
+            today: Today's date as a proleptic Gregorian ordinal
+            
+        Returns:
+            int: WEEKLY_COMPLETION_BONUS if it applies, otherwise 0
+        """
+        # The cheap checks run first so the timestamp is only converted when needed
+        last_activity = player.last_activity
+        if (player.current_streak >= cls.WEEKLY_STREAK_THRESHOLD and last_activity is not None
+                and today - date.fromtimestamp(last_activity).toordinal() <= cls.WEEKLY_WINDOW_DAYS):
+            return cls.WEEKLY_COMPLETION_BONUS
+        return 0
+    
     @classmethod
     def calculate_bonus_xp(cls, task: Task, player: PlayerData) -> int:
         """Calculate total bonus XP for task completion.
@@ -110,13 +144,8 @@ class XPCalculator:
         """
         base_xp = cls.calculate_base_xp(task.difficulty)
         
-        # Calculate multiplier bonuses
-        priority_multiplier = cls.calculate_priority_bonus(task)
-        streak_multiplier = cls.calculate_streak_bonus(player)
-        
-        # Apply multipliers to base XP
-        multiplied_xp = base_xp * priority_multiplier * streak_multiplier
-        multiplier_bonus = int(multiplied_xp - base_xp)
+        # Apply priority and streak multipliers to base XP, truncating once at the end
+        multiplier_bonus = base_xp * cls._multiplier(task, player) // _PERCENT_PRODUCT_SCALE - base_xp
         
         # Calculate flat bonuses
         flat_bonus = cls.calculate_completion_bonus(task, player)
@@ -134,10 +163,39 @@ class XPCalculator:
         Returns:
             int: Total XP reward (base + bonuses)
         """
-        base_xp = cls.calculate_base_xp(task.difficulty)
-        bonus_xp = cls.calculate_bonus_xp(task, player)
+        # Same result as base + calculate_bonus_xp, with each attribute read once
+        multiplied_xp = cls.calculate_base_xp(task.difficulty) * cls._multiplier(task, player) // _PERCENT_PRODUCT_SCALE
+        flat_bonus = cls.calculate_completion_bonus(task, player)
+        
+        return multiplied_xp + flat_bonus
+    
+    @classmethod
+    def calculate_total_xp_batch(cls, tasks: List[Task], player: PlayerData) -> List[int]:
+        """Calculate total XP rewards for several tasks for the same player.
+        
+        Gives the same values as calling calculate_total_xp per task, but the
+        player-dependent streak multiplier and weekly bonus are worked out once.
+        
+        Args:
+            tasks: Tasks to calculate rewards for
+            player: Current player data
+            
+        Returns:
+            List[int]: Total XP reward for each task, in the same order
+        """
+        today = date.today().toordinal()
+        streak_percent = _streak_percent(player.current_streak)
+        weekly_bonus = cls._weekly_bonus(player, today)
+        daily_bonus = cls.DAILY_COMPLETION_BONUS
+        
+        rewards = []
+        for task in tasks:
+            base_xp = cls.calculate_base_xp(task.difficulty)
+            multiplied_xp = base_xp * _priority_percent(task.priority) * streak_percent // _PERCENT_PRODUCT_SCALE
+            flat_bonus = weekly_bonus + (daily_bonus if task.created_at.toordinal() == today else 0)
+            rewards.append(multiplied_xp + flat_bonus)
         
-        return base_xp + bonus_xp
+        return rewards
     
     @classmethod
     def calculate_level(cls, total_xp: int) -> int:
@@ -149,10 +207,10 @@ class XPCalculator:
         Returns:
             int: Player level
         """
-        # Use the same formula as PlayerData.level property
-        if total_xp <= 0:
-            return 1
-        return int((total_xp / 100) ** 0.5) + 1
+        # Same progression as PlayerData.level, looked up in the threshold table
+        if total_xp < _LEVEL_THRESHOLDS[-1]:
+            return bisect_right(_LEVEL_THRESHOLDS, max(0, total_xp))
+        return math.isqrt(int(total_xp) // 100) + 1
     
     @classmethod
     def calculate_xp_for_level(cls, level: int) -> int:
@@ -166,6 +224,8 @@ class XPCalculator:
         """
         if level <= 1:
             return 0
+        if level <= MAX_LEVEL:
+            return _LEVEL_THRESHOLDS[level - 1]
         return (level - 1) ** 2 * 100
     
     @classmethod
@@ -179,9 +239,11 @@ class XPCalculator:
             int: XP needed for next level
         """
         current_level = cls.calculate_level(current_xp)
-        next_level_xp = cls.calculate_xp_for_level(current_level + 1)
         
-        return next_level_xp - current_xp
+        # Index i of the threshold table holds the start of level i + 1
+        if current_level < MAX_LEVEL:
+            return _LEVEL_THRESHOLDS[current_level] - current_xp
+        return cls.calculate_xp_for_level(current_level + 1) - current_xp
     
     @classmethod
     def preview_xp_reward(cls, task: Task, player: PlayerData) -> dict:
@@ -195,19 +257,22 @@ class XPCalculator:
             dict: Detailed XP breakdown
         """
         base_xp = cls.calculate_base_xp(task.difficulty)
-        priority_multiplier = cls.calculate_priority_bonus(task)
-        streak_multiplier = cls.calculate_streak_bonus(player)
+        priority_percent = _priority_percent(task.priority)
+        streak_percent = _streak_percent(player.current_streak)
+        priority_multiplier = priority_percent / 100
+        streak_multiplier = streak_percent / 100
         flat_bonus = cls.calculate_completion_bonus(task, player)
-        total_xp = cls.calculate_total_xp(task, player)
+        multiplier_bonus = base_xp * priority_percent * streak_percent // _PERCENT_PRODUCT_SCALE - base_xp
+        total_bonus = multiplier_bonus + flat_bonus
         
         return {
             'base_xp': base_xp,
             'priority_multiplier': priority_multiplier,
             'streak_multiplier': streak_multiplier,
-            'multiplier_bonus': int(base_xp * priority_multiplier * streak_multiplier - base_xp),
+            'multiplier_bonus': multiplier_bonus,
             'flat_bonus': flat_bonus,
-            'total_bonus': total_xp - base_xp,
-            'total_xp': total_xp,
+            'total_bonus': total_bonus,
+            'total_xp': base_xp + total_bonus,
             'breakdown': {
                 'difficulty': f"{task.difficulty.display_name} ({base_xp} XP)",
                 'priority': f"{task.priority.value} ({priority_multiplier:.1f}x)",
@@ -228,7 +293,49 @@ class XPCalculator:
         Returns:
             int: XP difference (positive = increase, negative = decrease)
         """
-        current_xp = cls.calculate_base_xp(current_difficulty)
-        new_xp = cls.calculate_base_xp(new_difficulty)
-        
-        return new_xp - current_xp
\ No newline at end of file
+        if current_difficulty is new_difficulty:
+            return 0
+        return new_difficulty.xp_value - current_difficulty.xp_value
+
+
+# Streak multiplier, in percent, for each streak length below _STREAK_TABLE_SIZE.
+# The bonus is capped well before the end of the table, so longer streaks use
+# the last entry.
+_STREAK_PERCENTS = tuple(
+    100 + min(
+        max(0, streak - XPCalculator.STREAK_BONUS_THRESHOLD + 1) * round(XPCalculator.STREAK_BONUS_MULTIPLIER * 100),
+        round(XPCalculator.MAX_STREAK_BONUS * 100)
+    )
+    for streak in range(_STREAK_TABLE_SIZE)
+)
+
+# PRIORITY_MULTIPLIERS in percent, by name and by enum member. The member table
+# lets lookups skip the Enum.name property.
+_PRIORITY_PERCENTS = {
+    name: round(multiplier * 100)
+    for name, multiplier in XPCalculator.PRIORITY_MULTIPLIERS.items()
+}
+_PRIORITY_PERCENTS_BY_MEMBER = {
+    priority: _PRIORITY_PERCENTS.get(priority.name, 100)
+    for priority in TaskPriority
+}
+
+
+def _priority_percent(priority) -> int:
+    """Return the XP multiplier for a priority, in percent.
+    
+    Anything that is not a TaskPriority member but has a name (test doubles,
+    for instance) is looked up by that name instead.
+    """
+    if type(priority) is TaskPriority:
+        return _PRIORITY_PERCENTS_BY_MEMBER[priority]
+    return _PRIORITY_PERCENTS.get(priority.name, 100)
+
+
+def _streak_percent(streak: int) -> int:
+    """Return the XP multiplier for a streak length, in percent."""
+    if streak <= 0:
+        return _STREAK_PERCENTS[0]
+    if streak < _STREAK_TABLE_SIZE:
+        return _STREAK_PERCENTS[streak]
+    return _STREAK_PERCENTS[-1]
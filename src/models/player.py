@@ -1,19 +1,44 @@
 """Player data model with level calculation and progress tracking."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 import math
+import sys
+import time
 
 
-@dataclass
+def _xp_threshold(level: int) -> int:
+    """Return the total XP at which the given level starts (100 * (level - 1)^2)."""
+    return 100 * (level - 1) ** 2
+
+
+def _parse_last_activity(value: Union[float, int, str, None]) -> Optional[float]:
+    """Convert a stored last_activity value to a Unix timestamp.
+    
+    Older save files store an ISO 8601 string, newer ones a numeric timestamp.
+    Only the "player" block of player.json is read back; the ISO string under
+    "statistics" comes from get_statistics and is for display only.
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    return float(value)
+
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep a per-instance __dict__.
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class PlayerData:
     """Player data with level calculation and progress tracking."""
     
     total_xp: int = 0
     tasks_completed: int = 0
     current_streak: int = 0
-    last_activity: Optional[datetime] = None
+    last_activity: Optional[float] = None  # Unix timestamp of the last completion
     easy_tasks_completed: int = 0
     medium_tasks_completed: int = 0
     hard_tasks_completed: int = 0
@@ -36,19 +61,17 @@ class PlayerData:
         """
         if self.total_xp <= 0:
             return 1
-        return int(math.sqrt(self.total_xp / 100)) + 1
+        return math.isqrt(int(self.total_xp) // 100) + 1
     
     @property
     def xp_for_current_level(self) -> int:
         """Calculate XP required to reach current level."""
-        if self.level <= 1:
-            return 0
-        return (self.level - 1) ** 2 * 100
+        return _xp_threshold(self.level)
     
     @property
     def xp_for_next_level(self) -> int:
         """Calculate XP required to reach next level."""
-        return self.level ** 2 * 100
+        return _xp_threshold(self.level + 1)
     
     @property
     def xp_to_next_level(self) -> int:
@@ -87,7 +110,7 @@ class PlayerData:
     def complete_task(self, xp_earned: int, difficulty_name: str) -> tuple[int, bool]:
         """Record task completion and return (new_level, level_up_occurred)."""
         self.tasks_completed += 1
-        self.last_activity = datetime.now()
+        self.last_activity = time.time()
         
         # Update difficulty-specific counters
         difficulty_lower = difficulty_name.lower()
@@ -108,27 +131,41 @@ class PlayerData:
         self.current_streak = 0
     
     def get_statistics(self) -> dict:
-        """Get player statistics summary."""
+        """Get player statistics summary, computing the level only once."""
+        level = self.level
+        current_level_xp = _xp_threshold(level)
+        next_level_xp = _xp_threshold(level + 1)
+        level_xp_range = next_level_xp - current_level_xp
+        progress_in_level = self.total_xp - current_level_xp
+        
         return {
-            'level': self.level,
+            'level': level,
             'total_xp': self.total_xp,
-            'xp_to_next_level': self.xp_to_next_level,
-            'level_progress': self.level_progress,
+            'xp_to_next_level': next_level_xp - self.total_xp,
+            'level_progress': min(1.0, max(0.0, progress_in_level / level_xp_range)),
             'tasks_completed': self.tasks_completed,
             'current_streak': self.current_streak,
             'easy_tasks_completed': self.easy_tasks_completed,
             'medium_tasks_completed': self.medium_tasks_completed,
             'hard_tasks_completed': self.hard_tasks_completed,
-            'last_activity': self.last_activity.isoformat() if self.last_activity else None
+            'last_activity': (
+                datetime.fromtimestamp(self.last_activity).isoformat()
+                if self.last_activity is not None else None
+            )
         }
     
     def to_dict(self) -> dict:
-        """Convert player data to dictionary for JSON serialization."""
+        """Convert player data to dictionary for JSON serialization.
+        
+        last_activity is written as a Unix timestamp. get_statistics() renders
+        the same value as an ISO string for display, so player.json
+        deliberately holds it in both formats.
+        """
         return {
             'total_xp': self.total_xp,
             'tasks_completed': self.tasks_completed,
             'current_streak': self.current_streak,
-            'last_activity': self.last_activity.isoformat() if self.last_activity else None,
+            'last_activity': self.last_activity,
             'easy_tasks_completed': self.easy_tasks_completed,
             'medium_tasks_completed': self.medium_tasks_completed,
             'hard_tasks_completed': self.hard_tasks_completed
@@ -141,7 +178,7 @@ class PlayerData:
             total_xp=data.get('total_xp', 0),
             tasks_completed=data.get('tasks_completed', 0),
             current_streak=data.get('current_streak', 0),
-            last_activity=datetime.fromisoformat(data['last_activity']) if data.get('last_activity') else None,
+            last_activity=_parse_last_activity(data.get('last_activity')),
             easy_tasks_completed=data.get('easy_tasks_completed', 0),
             medium_tasks_completed=data.get('medium_tasks_completed', 0),
             hard_tasks_completed=data.get('hard_tasks_completed', 0)
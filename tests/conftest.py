@@ -0,0 +1,133 @@
+"""Shared fixtures for the test suite.
+
+Tests may run under pytest-xdist, where any worker may run any test. Module-level
+test data must be immutable or copied before use, and shared templates here
+are handed out as deep copies.
+"""
+
+import copy
+import itertools
+import pytest
+from types import SimpleNamespace
+
+from src.business.task_manager import TaskManager
+from src.models.enums import TaskDifficulty, TaskPriority, TaskStatus
+from src.models.task import Task
+from tests.helpers import FastDataManager, FrozenDatetime, StubDataManager
+
+
+@pytest.fixture(autouse=True)
+def _deterministic_task_ids(monkeypatch):
+    """Generate sequential task IDs instead of random UUID4s.
+    
+    IDs are reproducible from run to run, which keeps failures and xdist
+    work distribution stable and skips the urandom call per Task.
+    """
+    counter = itertools.count()
+    fake_uuid = SimpleNamespace(uuid4=lambda: f"test-task-{next(counter):08d}")
+    monkeypatch.setattr("src.models.task.uuid", fake_uuid)
+    monkeypatch.setattr("src.business.task_manager.uuid", fake_uuid)
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """Freeze the clock used by Task completion."""
+    monkeypatch.setattr("src.models.task.datetime", FrozenDatetime)
+
+
+@pytest.fixture
+def recording_dm():
+    """Create call-recording stub DataManager for tests that assert on it."""
+    return StubDataManager()
+
+
+@pytest.fixture
+def fast_dm():
+    """Create no-op DataManager for tests that ignore persistence calls."""
+    return FastDataManager()
+
+
+@pytest.fixture
+def task_manager(fast_dm):
+    """Create TaskManager instance for testing."""
+    return TaskManager(fast_dm)
+
+
+@pytest.fixture
+def recording_task_manager(recording_dm):
+    """Create TaskManager backed by the recording_dm stub."""
+    return TaskManager(recording_dm)
+
+
+@pytest.fixture(scope="session")
+def _sample_task_template():
+    """Pending task built once per session; use sample_task in tests."""
+    return Task(
+        title="Sample task",
+        difficulty=TaskDifficulty.MEDIUM,
+        priority=TaskPriority.HIGH,
+        notes="Sample notes"
+    )
+
+
+@pytest.fixture(scope="session")
+def _completed_task_template():
+    """Completed task built once per session; use completed_task in tests."""
+    task = Task(
+        title="Completed task",
+        difficulty=TaskDifficulty.HARD,
+        priority=TaskPriority.CRITICAL,
+        notes="Completed notes"
+    )
+    task.complete()
+    return task
+
+
+@pytest.fixture(scope="session")
+def _active_task_template():
+    """Active task built once per session; use active_task in tests."""
+    task = Task(
+        title="Active task",
+        difficulty=TaskDifficulty.EASY,
+        priority=TaskPriority.MEDIUM,
+        notes="Active notes"
+    )
+    task.status = TaskStatus.ACTIVE
+    return task
+
+
+@pytest.fixture
+def sample_task(_sample_task_template):
+    """Create sample task for testing."""
+    return copy.deepcopy(_sample_task_template)
+
+
+@pytest.fixture
+def completed_task(_completed_task_template):
+    """Create completed task for testing."""
+    return copy.deepcopy(_completed_task_template)
+
+
+@pytest.fixture
+def active_task(_active_task_template):
+    """Create active task for testing."""
+    return copy.deepcopy(_active_task_template)
+
+
+@pytest.fixture
+def task_factory():
+    """Create factory building real Tasks from low-risk defaults plus overrides."""
+    def make(title="Factory task", difficulty=TaskDifficulty.EASY,
+             priority=TaskPriority.LOW, complete=False, **overrides):
+        task = Task(title=title, difficulty=difficulty, priority=priority, **overrides)
+        if complete:
+            task.complete()
+        return task
+    return make
+
+
+@pytest.fixture
+def seeded_manager(task_manager, sample_task):
+    """Create TaskManager already holding sample_task, as (manager, task)."""
+    task_manager._tasks[sample_task.id] = sample_task
+    return task_manager, sample_task
@@ -0,0 +1,70 @@
+"""Test doubles and fixed clock values shared across the test suite."""
+
+import copy
+from datetime import date, datetime
+from unittest.mock import MagicMock
+
+from src.models.player import PlayerData
+
+
+# Built once at import; each stub hands out a deep copy so tests can mutate it.
+_PLAYER_DATA_TEMPLATE = PlayerData()
+
+FIXED_DT = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() always returns FIXED_DT."""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return FIXED_DT
+
+
+class FrozenDate(date):
+    """date whose today() always returns FIXED_DT's date."""
+    
+    @classmethod
+    def today(cls):
+        return cls(FIXED_DT.year, FIXED_DT.month, FIXED_DT.day)
+
+
+class StubDataManager:
+    """Lightweight stand-in for DataManager.
+    
+    Exposes only the methods TaskManager calls, as MagicMock attributes, so
+    tests can still configure side effects and assert on calls without the
+    cost of building a Mock(spec=DataManager) for every test.
+    """
+    
+    def __init__(self):
+        self.load_tasks = MagicMock(return_value={})
+        self.load_player_data = MagicMock(
+            side_effect=lambda: copy.deepcopy(_PLAYER_DATA_TEMPLATE)
+        )
+        self.save_tasks = MagicMock(return_value=True)
+        self.save_player_data = MagicMock(return_value=True)
+        self.create_backup = MagicMock(return_value=True)
+
+
+class FastDataManager:
+    """No-op stand-in for DataManager that records nothing.
+    
+    For tests that never assert on or reconfigure DataManager calls, so they
+    skip MagicMock's call bookkeeping.
+    """
+    
+    def load_tasks(self):
+        return {}
+    
+    def load_player_data(self):
+        return copy.deepcopy(_PLAYER_DATA_TEMPLATE)
+    
+    def save_tasks(self, tasks):
+        return True
+    
+    def save_player_data(self, player_data):
+        return True
+    
+    def create_backup(self):
+        return True
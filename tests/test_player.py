@@ -1,10 +1,22 @@
 """Tests for PlayerData model."""
 
+import copy
+import sys
+from dataclasses import asdict
+
 import pytest
 from datetime import datetime
 from src.models.player import PlayerData
 
 
+INVALID_CASES = [
+    pytest.param(lambda: PlayerData(total_xp=-10), "Total XP cannot be negative", id="negative-total-xp"),
+    pytest.param(lambda: PlayerData(tasks_completed=-1), "Tasks completed cannot be negative", id="negative-tasks"),
+    pytest.param(lambda: PlayerData(current_streak=-1), "Current streak cannot be negative", id="negative-streak"),
+    pytest.param(lambda: PlayerData(total_xp=50).add_xp(-10), "XP amount cannot be negative", id="negative-add-xp"),
+]
+
+
 class TestPlayerData:
     """Test PlayerData model."""
     
@@ -22,7 +34,7 @@ class TestPlayerData:
     
     def test_player_creation_with_values(self):
         """Test creating player with specific values."""
-        last_activity = datetime.now()
+        last_activity = datetime.now().timestamp()
         player = PlayerData(
             total_xp=150,
             tasks_completed=10,
@@ -41,19 +53,11 @@ class TestPlayerData:
         assert player.medium_tasks_completed == 3
         assert player.hard_tasks_completed == 1
     
-    def test_player_validation(self):
+    @pytest.mark.parametrize("action,message", INVALID_CASES)
+    def test_player_validation(self, action, message):
         """Test player data validation."""
-        # Negative total XP should raise error
-        with pytest.raises(ValueError, match="Total XP cannot be negative"):
-            PlayerData(total_xp=-10)
-        
-        # Negative tasks completed should raise error
-        with pytest.raises(ValueError, match="Tasks completed cannot be negative"):
-            PlayerData(tasks_completed=-1)
-        
-        # Negative streak should raise error
-        with pytest.raises(ValueError, match="Current streak cannot be negative"):
-            PlayerData(current_streak=-1)
+        with pytest.raises(ValueError, match=message):
+            action()
     
     def test_level_calculation(self):
         """Test player level calculation."""
@@ -81,6 +85,12 @@ class TestPlayerData:
         # Level 10 at 8100 XP
         player.total_xp = 8100
         assert player.level == 10
+        
+        # Float XP (e.g. loaded from JSON) is truncated, not rejected
+        player = PlayerData(total_xp=150.0)
+        assert player.level == 2
+        assert player.xp_for_next_level == 400
+        assert player.get_statistics()['level'] == 2
     
     def test_xp_calculations(self):
         """Test XP calculation properties."""
@@ -97,23 +107,23 @@ class TestPlayerData:
         
         # At level 1 with 0 XP
         player.total_xp = 0
-        assert player.level_progress == 0.0
+        assert player.level_progress == pytest.approx(0.0)
         
         # At level 1 with 50 XP (halfway to level 2)
         player.total_xp = 50
-        assert player.level_progress == 0.5
+        assert player.level_progress == pytest.approx(0.5)
         
         # At level 1 with 99 XP (almost level 2)
         player.total_xp = 99
-        assert abs(player.level_progress - 0.99) < 0.01
+        assert player.level_progress == pytest.approx(0.99, abs=0.01)
         
         # At level 2 with 100 XP (start of level 2)
         player.total_xp = 100
-        assert player.level_progress == 0.0
+        assert player.level_progress == pytest.approx(0.0)
         
         # At level 2 with 250 XP (halfway to level 3)
         player.total_xp = 250
-        assert player.level_progress == 0.5
+        assert player.level_progress == pytest.approx(0.5)
     
     def test_add_xp(self):
         """Test adding XP and level up detection."""
@@ -130,10 +140,6 @@ class TestPlayerData:
         assert player.total_xp == 130
         assert new_level == 2
         assert level_up
-        
-        # Cannot add negative XP
-        with pytest.raises(ValueError, match="XP amount cannot be negative"):
-            player.add_xp(-10)
     
     def test_complete_task(self):
         """Test task completion tracking."""
@@ -148,7 +154,7 @@ class TestPlayerData:
         assert player.medium_tasks_completed == 0
         assert player.hard_tasks_completed == 0
         assert player.current_streak == 1
-        assert isinstance(player.last_activity, datetime)
+        assert isinstance(player.last_activity, float)
         assert new_level == 1
         assert not level_up
         
@@ -188,7 +194,7 @@ class TestPlayerData:
     
     def test_get_statistics(self):
         """Test statistics summary."""
-        last_activity = datetime.now()
+        last_activity = datetime.now().timestamp()
         player = PlayerData(
             total_xp=250,
             tasks_completed=10,
@@ -217,11 +223,11 @@ class TestPlayerData:
         assert stats['easy_tasks_completed'] == 6
         assert stats['medium_tasks_completed'] == 3
         assert stats['hard_tasks_completed'] == 1
-        assert stats['last_activity'] == last_activity.isoformat()
+        assert stats['last_activity'] == datetime.fromtimestamp(last_activity).isoformat()
     
     def test_player_serialization(self):
         """Test player to_dict and from_dict methods."""
-        last_activity = datetime.now()
+        last_activity = datetime.now().timestamp()
         original_player = PlayerData(
             total_xp=300,
             tasks_completed=15,
@@ -244,7 +250,8 @@ class TestPlayerData:
         assert player_dict['total_xp'] == 300
         assert player_dict['tasks_completed'] == 15
         assert player_dict['current_streak'] == 7
-        assert player_dict['last_activity'] == last_activity.isoformat()
+        assert isinstance(player_dict['last_activity'], float)
+        assert player_dict['last_activity'] == last_activity
         assert player_dict['easy_tasks_completed'] == 8
         assert player_dict['medium_tasks_completed'] == 5
         assert player_dict['hard_tasks_completed'] == 2
@@ -268,4 +275,46 @@ class TestPlayerData:
         assert player_dict['last_activity'] is None
         
         restored_player = PlayerData.from_dict(player_dict)
-        assert restored_player.last_activity is None
\ No newline at end of file
+        assert restored_player.last_activity is None
+    
+    def test_player_deserialization_with_iso_activity(self):
+        """Test loading last_activity saved as an ISO string by older versions."""
+        last_activity = datetime(2024, 1, 1, 12, 0, 0)
+        
+        restored_player = PlayerData.from_dict({'last_activity': last_activity.isoformat()})
+        
+        assert restored_player.last_activity == last_activity.timestamp()
+    
+    def test_get_statistics_reflects_updates(self):
+        """Test statistics are recomputed from the current player state on each call."""
+        player = PlayerData(total_xp=50)
+        assert player.get_statistics()['total_xp'] == 50
+        
+        player.complete_task(60, "medium")
+        stats = player.get_statistics()
+        assert stats['level'] == 2
+        assert stats['total_xp'] == 110
+        assert stats['tasks_completed'] == 1
+        assert stats['medium_tasks_completed'] == 1
+        
+        player.total_xp = 400
+        assert player.get_statistics()['level'] == 3
+    
+    def test_dataclass_fields_are_public_state_only(self):
+        """Test asdict() exposes exactly the persisted player fields."""
+        player = PlayerData(total_xp=150)
+        
+        assert asdict(player) == player.to_dict()
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+    def test_player_uses_slots(self):
+        """Test PlayerData instances are slotted and still copy cleanly."""
+        player = PlayerData(total_xp=150, current_streak=2)
+        
+        assert not hasattr(player, '__dict__')
+        with pytest.raises(AttributeError):
+            player.unknown_field = 1
+        
+        clone = copy.deepcopy(player)
+        assert clone == player
+        assert clone.get_statistics() == player.get_statistics()
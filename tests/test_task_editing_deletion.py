@@ -1,100 +1,58 @@
 """Unit tests for task editing and deletion functionality with comprehensive edge cases."""
 
+import json
+import re
 import pytest
-from unittest.mock import Mock, patch
-from datetime import datetime
+from typing import List, NamedTuple
 
 from src.business.task_manager import (
-    TaskManager, TaskManagerError, TaskNotFoundError, TaskStateError
+    TaskNotFoundError, TaskStateError,
+    WARNING_ACTIVE_TASK, WARNING_BACKUP_FAILED, WARNING_COMPLETED_TASK,
+    WARNING_HIGH_PRIORITY, WARNING_HIGH_XP
 )
 from src.business.task_validator import TaskValidationError
-from src.data.data_manager import DataManager
 from src.models.enums import TaskDifficulty, TaskPriority, TaskStatus
-from src.models.task import Task
-from src.models.player import PlayerData
+
+_XP = {difficulty: difficulty.xp_value for difficulty in TaskDifficulty}
+
+_CHANGE_STATUS_RE = re.compile("Cannot change status of completed task")
+_CHANGE_DIFFICULTY_RE = re.compile("Cannot change difficulty of completed task")
+_NOT_FOUND_RE = re.compile("not found")
+
+
+class ObsCall(NamedTuple):
+    """Observer notification captured by the integration tests."""
+    action: str
+    task_id: str
+    title: str
 
 
 class TestTaskEditing:
     """Test task editing functionality with validation and XP recalculation."""
     
-    @pytest.fixture
-    def mock_data_manager(self):
-        """Create mock DataManager for testing."""
-        mock_dm = Mock(spec=DataManager)
-        mock_dm.load_tasks.return_value = {}
-        mock_dm.load_player_data.return_value = PlayerData()
-        mock_dm.save_tasks.return_value = True
-        mock_dm.save_player_data.return_value = True
-        mock_dm.create_backup.return_value = True
-        return mock_dm
-    
-    @pytest.fixture
-    def task_manager(self, mock_data_manager):
-        """Create TaskManager instance for testing."""
-        return TaskManager(mock_data_manager)
-    
-    @pytest.fixture
-    def sample_task(self):
-        """Create sample task for testing."""
-        return Task(
-            title="Original task",
-            difficulty=TaskDifficulty.MEDIUM,
-            priority=TaskPriority.HIGH,
-            notes="Original notes"
-        )
-    
-    @pytest.fixture
-    def completed_task(self):
-        """Create completed task for testing."""
-        task = Task(
-            title="Completed task",
-            difficulty=TaskDifficulty.HARD,
-            priority=TaskPriority.CRITICAL,
-            notes="Completed notes"
-        )
-        task.complete()
-        return task
-    
-    def test_update_task_title_success(self, task_manager, sample_task):
-        """Test successful task title update."""
-        task_manager._tasks[sample_task.id] = sample_task
-        
-        updated_task = task_manager.update_task(sample_task.id, title="Updated title")
-        
-        assert updated_task.title == "Updated title"
-        assert updated_task.difficulty == sample_task.difficulty  # Unchanged
-        assert updated_task.priority == sample_task.priority  # Unchanged
-    
-    def test_update_task_difficulty_success(self, task_manager, sample_task):
-        """Test successful task difficulty update with XP recalculation."""
-        task_manager._tasks[sample_task.id] = sample_task
+    @pytest.mark.parametrize("field,value,xp_changes", [
+        ("title", "Updated title", False),
+        ("difficulty", TaskDifficulty.HARD, True),
+        ("priority", TaskPriority.CRITICAL, False),
+        ("notes", "Updated notes", False),
+    ])
+    def test_update_task_field_success(self, seeded_manager, field, value, xp_changes):
+        """Test successful single-field task update with XP recalculation."""
+        task_manager, sample_task = seeded_manager
         original_xp = sample_task.xp_reward
         
-        updated_task = task_manager.update_task(sample_task.id, difficulty=TaskDifficulty.HARD)
-        
-        assert updated_task.difficulty == TaskDifficulty.HARD
-        assert updated_task.xp_reward == TaskDifficulty.HARD.xp_value
-        assert updated_task.xp_reward != original_xp
-    
-    def test_update_task_priority_success(self, task_manager, sample_task):
-        """Test successful task priority update."""
-        task_manager._tasks[sample_task.id] = sample_task
-        
-        updated_task = task_manager.update_task(sample_task.id, priority=TaskPriority.CRITICAL)
+        updated_task = task_manager.update_task(sample_task.id, **{field: value})
         
-        assert updated_task.priority == TaskPriority.CRITICAL
+        assert getattr(updated_task, field) == value
+        if xp_changes:
+            assert updated_task.xp_reward == _XP[TaskDifficulty.HARD]
+            assert updated_task.xp_reward != original_xp
+        else:
+            assert updated_task.xp_reward == original_xp
     
-    def test_update_task_notes_success(self, task_manager, sample_task):
-        """Test successful task notes update."""
-        task_manager._tasks[sample_task.id] = sample_task
-        
-        updated_task = task_manager.update_task(sample_task.id, notes="Updated notes")
-        
-        assert updated_task.notes == "Updated notes"
-    
-    def test_update_task_multiple_fields(self, task_manager, sample_task):
+    def test_update_task_multiple_fields(self, seeded_manager):
         """Test updating multiple task fields simultaneously."""
-        task_manager._tasks[sample_task.id] = sample_task
+        task_manager, sample_task = seeded_manager
         
         updated_task = task_manager.update_task(
             sample_task.id,
@@ -108,52 +66,46 @@ class TestTaskEditing:
         assert updated_task.difficulty == TaskDifficulty.EASY
         assert updated_task.priority == TaskPriority.LOW
         assert updated_task.notes == "New notes"
-        assert updated_task.xp_reward == TaskDifficulty.EASY.xp_value
-    
-    def test_update_task_status_transition(self, task_manager, sample_task):
+        assert updated_task.xp_reward == _XP[TaskDifficulty.EASY]
+    
+    @pytest.mark.parametrize("from_status,to_status", [
+        (TaskStatus.PENDING, TaskStatus.ACTIVE),
+        (TaskStatus.ACTIVE, TaskStatus.BLOCKED),
+        (TaskStatus.BLOCKED, TaskStatus.PENDING),
+    ], ids=["pending->active", "active->blocked", "blocked->pending"])
+    def test_update_task_status_transition(self, seeded_manager, from_status, to_status):
         """Test valid task status transitions."""
-        task_manager._tasks[sample_task.id] = sample_task
-        
-        # Pending -> Active
-        updated_task = task_manager.update_task(sample_task.id, status=TaskStatus.ACTIVE)
-        assert updated_task.status == TaskStatus.ACTIVE
+        task_manager, sample_task = seeded_manager
+        sample_task.status = from_status
         
-        # Active -> Blocked
-        updated_task = task_manager.update_task(sample_task.id, status=TaskStatus.BLOCKED)
-        assert updated_task.status == TaskStatus.BLOCKED
-        
-        # Blocked -> Pending
-        updated_task = task_manager.update_task(sample_task.id, status=TaskStatus.PENDING)
-        assert updated_task.status == TaskStatus.PENDING
+        updated_task = task_manager.update_task(sample_task.id, status=to_status)
+        assert updated_task.status == to_status
     
-    def test_update_task_invalid_title(self, task_manager, sample_task):
+    def test_update_task_invalid_title(self, seeded_manager):
         """Test task update with invalid title."""
-        task_manager._tasks[sample_task.id] = sample_task
+        task_manager, sample_task = seeded_manager
         
         with pytest.raises(TaskValidationError, match="Title validation failed"):
             task_manager.update_task(sample_task.id, title="")
     
-    def test_update_task_invalid_status_transition(self, task_manager, sample_task):
+    def test_update_task_invalid_status_transition(self, seeded_manager):
         """Test task update with invalid status transition."""
-        task_manager._tasks[sample_task.id] = sample_task
+        task_manager, sample_task = seeded_manager
         sample_task.status = TaskStatus.COMPLETED
         
-        with pytest.raises(TaskStateError, match="Cannot change status of completed task"):
+        with pytest.raises(TaskStateError, match=_CHANGE_STATUS_RE):
             task_manager.update_task(sample_task.id, status=TaskStatus.PENDING)
     
-    def test_update_completed_task_difficulty_forbidden(self, task_manager, completed_task):
-        """Test that completed task difficulty cannot be changed."""
-        task_manager._tasks[completed_task.id] = completed_task
-        
-        with pytest.raises(TaskStateError, match="Cannot change difficulty of completed task"):
-            task_manager.update_task(completed_task.id, difficulty=TaskDifficulty.EASY)
-    
-    def test_update_completed_task_status_forbidden(self, task_manager, completed_task):
-        """Test that completed task status cannot be changed away from completed."""
+    @pytest.mark.parametrize("field,value,match", [
+        ("difficulty", TaskDifficulty.EASY, _CHANGE_DIFFICULTY_RE),
+        ("status", TaskStatus.PENDING, _CHANGE_STATUS_RE),
+    ])
+    def test_update_completed_task_forbidden(self, task_manager, completed_task, field, value, match):
+        """Test that completed task difficulty and status cannot be changed."""
         task_manager._tasks[completed_task.id] = completed_task
         
-        with pytest.raises(TaskStateError, match="Cannot change status of completed task"):
-            task_manager.update_task(completed_task.id, status=TaskStatus.PENDING)
+        with pytest.raises(TaskStateError, match=match):
+            task_manager.update_task(completed_task.id, **{field: value})
     
     def test_update_completed_task_allowed_fields(self, task_manager, completed_task):
         """Test that completed task title, priority, and notes can be updated."""
@@ -174,12 +126,12 @@ class TestTaskEditing:
     
     def test_update_task_not_found(self, task_manager):
         """Test updating non-existent task."""
-        with pytest.raises(TaskNotFoundError, match="not found"):
+        with pytest.raises(TaskNotFoundError, match=_NOT_FOUND_RE):
             task_manager.update_task("non-existent", title="New title")
     
-    def test_validate_task_update_success(self, task_manager, sample_task):
+    def test_validate_task_update_success(self, seeded_manager):
         """Test task update validation without applying changes."""
-        task_manager._tasks[sample_task.id] = sample_task
+        task_manager, sample_task = seeded_manager
         
         result = task_manager.validate_task_update(
             sample_task.id,
@@ -208,9 +160,9 @@ class TestTaskEditing:
         assert any("difficulty" in error for error in result['errors'])
         assert any("status" in error for error in result['errors'])
     
-    def test_validate_task_update_warnings(self, task_manager, sample_task):
+    def test_validate_task_update_warnings(self, seeded_manager):
         """Test task update validation generates appropriate warnings."""
-        task_manager._tasks[sample_task.id] = sample_task
+        task_manager, sample_task = seeded_manager
         
         result = task_manager.validate_task_update(
             sample_task.id,
@@ -229,59 +181,9 @@ class TestTaskEditing:
 class TestTaskDeletion:
     """Test task deletion functionality with safety checks and warnings."""
     
-    @pytest.fixture
-    def mock_data_manager(self):
-        """Create mock DataManager for testing."""
-        mock_dm = Mock(spec=DataManager)
-        mock_dm.load_tasks.return_value = {}
-        mock_dm.load_player_data.return_value = PlayerData()
-        mock_dm.save_tasks.return_value = True
-        mock_dm.save_player_data.return_value = True
-        mock_dm.create_backup.return_value = True
-        return mock_dm
-    
-    @pytest.fixture
-    def task_manager(self, mock_data_manager):
-        """Create TaskManager instance for testing."""
-        return TaskManager(mock_data_manager)
-    
-    @pytest.fixture
-    def sample_task(self):
-        """Create sample task for testing."""
-        return Task(
-            title="Sample task",
-            difficulty=TaskDifficulty.MEDIUM,
-            priority=TaskPriority.HIGH,
-            notes="Sample notes"
-        )
-    
-    @pytest.fixture
-    def completed_task(self):
-        """Create completed task for testing."""
-        task = Task(
-            title="Completed task",
-            difficulty=TaskDifficulty.HARD,
-            priority=TaskPriority.CRITICAL,
-            notes="Completed notes"
-        )
-        task.complete()
-        return task
-    
-    @pytest.fixture
-    def active_task(self):
-        """Create active task for testing."""
-        task = Task(
-            title="Active task",
-            difficulty=TaskDifficulty.EASY,
-            priority=TaskPriority.MEDIUM,
-            notes="Active notes"
-        )
-        task.status = TaskStatus.ACTIVE
-        return task
-    
-    def test_delete_pending_task_success(self, task_manager, sample_task):
+    def test_delete_pending_task_success(self, seeded_manager):
         """Test successful deletion of pending task."""
-        task_manager._tasks[sample_task.id] = sample_task
+        task_manager, sample_task = seeded_manager
         
         result = task_manager.delete_task(sample_task.id)
         
@@ -305,7 +207,7 @@ class TestTaskDeletion:
         
         assert result['success'] is True
         assert completed_task.id not in task_manager._tasks
-        assert any("XP history will be preserved" in warning for warning in result['warnings'])
+        assert WARNING_COMPLETED_TASK in result['warning_codes']
     
     def test_delete_active_task_warning(self, task_manager, active_task):
         """Test deletion of active task generates warning."""
@@ -315,192 +217,143 @@ class TestTaskDeletion:
         
         assert result['success'] is True
         assert active_task.id not in task_manager._tasks
-        assert any("active task" in warning for warning in result['warnings'])
+        assert WARNING_ACTIVE_TASK in result['warning_codes']
     
-    def test_delete_high_priority_task_warning(self, task_manager, sample_task):
+    def test_delete_high_priority_task_warning(self, seeded_manager):
         """Test deletion of high priority task generates warning."""
+        task_manager, sample_task = seeded_manager
         sample_task.priority = TaskPriority.CRITICAL
-        task_manager._tasks[sample_task.id] = sample_task
         
         result = task_manager.delete_task(sample_task.id)
         
         assert result['success'] is True
-        assert any("critical priority" in warning for warning in result['warnings'])
+        assert WARNING_HIGH_PRIORITY in result['warning_codes']
     
     def test_delete_task_not_found(self, task_manager):
         """Test deleting non-existent task."""
-        with pytest.raises(TaskNotFoundError, match="not found"):
+        with pytest.raises(TaskNotFoundError, match=_NOT_FOUND_RE):
             task_manager.delete_task("non-existent")
     
-    def test_delete_task_creates_backup(self, task_manager, sample_task, mock_data_manager):
+    def test_delete_task_creates_backup(self, recording_task_manager, recording_dm, sample_task):
         """Test that task deletion creates backup."""
-        task_manager._tasks[sample_task.id] = sample_task
+        recording_task_manager._tasks[sample_task.id] = sample_task
         
-        result = task_manager.delete_task(sample_task.id)
+        result = recording_task_manager.delete_task(sample_task.id)
         
         assert result['success'] is True
-        mock_data_manager.create_backup.assert_called_once()
+        recording_dm.create_backup.assert_called_once()
     
-    def test_delete_task_backup_failure(self, task_manager, sample_task, mock_data_manager):
+    def test_delete_task_backup_failure(self, recording_task_manager, recording_dm, sample_task):
         """Test task deletion when backup creation fails."""
-        task_manager._tasks[sample_task.id] = sample_task
-        mock_data_manager.create_backup.side_effect = Exception("Backup failed")
+        recording_task_manager._tasks[sample_task.id] = sample_task
+        recording_dm.create_backup.side_effect = Exception("Backup failed")
         
-        result = task_manager.delete_task(sample_task.id)
+        result = recording_task_manager.delete_task(sample_task.id)
         
         assert result['success'] is True  # Deletion should still succeed
-        assert any("Could not create backup" in warning for warning in result['warnings'])
-    
-    def test_check_deletion_safety_pending_task(self, task_manager, sample_task):
-        """Test deletion safety check for pending task."""
-        task_manager._tasks[sample_task.id] = sample_task
-        
-        result = task_manager.check_deletion_safety(sample_task.id)
-        
-        assert result['safety_level'] in ['safe', 'caution']  # May be caution due to high priority
-        assert result['task_info']['title'] == sample_task.title
-    
-    def test_check_deletion_safety_completed_task(self, task_manager, completed_task):
-        """Test deletion safety check for completed task."""
-        task_manager._tasks[completed_task.id] = completed_task
-        
-        result = task_manager.check_deletion_safety(completed_task.id)
-        
-        assert result['requires_confirmation'] is True
-        assert result['safety_level'] == 'danger'
-        assert any("awarded" in warning and "XP" in warning for warning in result['warnings'])
-    
-    def test_check_deletion_safety_active_task(self, task_manager, active_task):
-        """Test deletion safety check for active task."""
-        task_manager._tasks[active_task.id] = active_task
-        
-        result = task_manager.check_deletion_safety(active_task.id)
-        
-        assert result['requires_confirmation'] is True
-        assert result['safety_level'] == 'caution'
-        assert any("currently active" in warning for warning in result['warnings'])
-    
-    def test_check_deletion_safety_high_priority(self, task_manager, sample_task):
-        """Test deletion safety check for high priority task."""
-        sample_task.priority = TaskPriority.CRITICAL
-        task_manager._tasks[sample_task.id] = sample_task
-        
-        result = task_manager.check_deletion_safety(sample_task.id)
-        
-        assert result['requires_confirmation'] is True
-        assert result['safety_level'] in ['caution', 'danger']
-        assert any("critical priority" in warning for warning in result['warnings'])
-    
-    def test_check_deletion_safety_high_xp_task(self, task_manager):
-        """Test deletion safety check for high XP value task."""
-        high_xp_task = Task(
-            title="High XP task",
-            difficulty=TaskDifficulty.HARD,  # 50 XP
-            priority=TaskPriority.LOW
-        )
-        task_manager._tasks[high_xp_task.id] = high_xp_task
-        
-        result = task_manager.check_deletion_safety(high_xp_task.id)
-        
-        assert result['safety_level'] in ['caution', 'danger']
-        assert any("high XP value" in warning for warning in result['warnings'])
+        assert WARNING_BACKUP_FAILED in result['warning_codes']
+    
+    @pytest.mark.parametrize("kwargs,expected_level,expected_confirm,expected_codes", [
+        (dict(), "safe", False, []),
+        (dict(complete=True), "danger", True, [WARNING_COMPLETED_TASK]),
+        (dict(status=TaskStatus.ACTIVE), "caution", True, [WARNING_ACTIVE_TASK]),
+        (dict(priority=TaskPriority.CRITICAL), "caution", True, [WARNING_HIGH_PRIORITY]),
+        (dict(difficulty=TaskDifficulty.HARD), "caution", False, [WARNING_HIGH_XP]),
+    ], ids=["pending", "completed", "active", "critical-priority", "high-xp"])
+    def test_check_deletion_safety(self, task_manager, task_factory, kwargs,
+                                   expected_level, expected_confirm, expected_codes):
+        """Test deletion safety level, confirmation and warnings per task state."""
+        task = task_factory(**kwargs)
+        task_manager._tasks[task.id] = task
+        
+        result = task_manager.check_deletion_safety(task.id)
+        
+        assert result['safety_level'] == expected_level
+        assert result['requires_confirmation'] is expected_confirm
+        assert result['task_info']['title'] == task.title
+        assert result['warning_codes'] == expected_codes
+        assert len(result['warnings']) == len(expected_codes)
+    
+    def test_check_deletion_safety_is_json_serializable(self, task_manager, task_factory):
+        """Test the safety check result, including warning codes, survives a JSON round trip."""
+        task = task_factory(priority=TaskPriority.CRITICAL, difficulty=TaskDifficulty.HARD)
+        task_manager._tasks[task.id] = task
+        
+        result = task_manager.check_deletion_safety(task.id)
+        
+        assert json.loads(json.dumps(result)) == result
+        assert result['warning_codes'] == [WARNING_HIGH_PRIORITY, WARNING_HIGH_XP]
     
     def test_check_deletion_safety_not_found(self, task_manager):
         """Test deletion safety check for non-existent task."""
-        with pytest.raises(TaskNotFoundError, match="not found"):
+        with pytest.raises(TaskNotFoundError, match=_NOT_FOUND_RE):
             task_manager.check_deletion_safety("non-existent")
 
 
+@pytest.mark.slow
 class TestTaskEditingDeletionIntegration:
     """Integration tests for task editing and deletion workflows."""
     
-    @pytest.fixture
-    def mock_data_manager(self):
-        """Create mock DataManager for testing."""
-        mock_dm = Mock(spec=DataManager)
-        mock_dm.load_tasks.return_value = {}
-        mock_dm.load_player_data.return_value = PlayerData()
-        mock_dm.save_tasks.return_value = True
-        mock_dm.save_player_data.return_value = True
-        mock_dm.create_backup.return_value = True
-        return mock_dm
-    
-    @pytest.fixture
-    def task_manager(self, mock_data_manager):
-        """Create TaskManager instance for testing."""
-        return TaskManager(mock_data_manager)
-    
-    def test_edit_then_delete_workflow(self, task_manager):
-        """Test complete edit then delete workflow."""
+    @pytest.mark.parametrize("complete_midway", [
+        pytest.param(False, id="pending"),
+        pytest.param(True, id="completed"),
+    ])
+    def test_full_workflow(self, task_manager, complete_midway):
+        """Test create, edit and delete workflow with and without completion."""
         # Create task
         task = task_manager.create_task(
-            title="Original task",
-            difficulty=TaskDifficulty.EASY,
-            priority=TaskPriority.LOW
+            title="Workflow task",
+            difficulty=TaskDifficulty.MEDIUM,
+            priority=TaskPriority.HIGH
         )
         
-        # Edit task
+        if complete_midway:
+            completed_task, xp_earned = task_manager.complete_task(task.id)
+            assert completed_task.is_completed
+            assert xp_earned > 0
+            
+            # Try to edit difficulty (should fail)
+            with pytest.raises(TaskStateError):
+                task_manager.update_task(task.id, difficulty=TaskDifficulty.EASY)
+        else:
+            # Edit difficulty and priority
+            updated_task = task_manager.update_task(
+                task.id,
+                difficulty=TaskDifficulty.HARD,
+                priority=TaskPriority.CRITICAL
+            )
+            assert updated_task.difficulty == TaskDifficulty.HARD
+            assert updated_task.priority == TaskPriority.CRITICAL
+        
+        # Edit allowed fields (should succeed either way)
         updated_task = task_manager.update_task(
             task.id,
             title="Updated task",
-            difficulty=TaskDifficulty.HARD,
-            priority=TaskPriority.CRITICAL
+            notes="Updated notes"
         )
-        
         assert updated_task.title == "Updated task"
-        assert updated_task.difficulty == TaskDifficulty.HARD
-        assert updated_task.priority == TaskPriority.CRITICAL
+        assert updated_task.notes == "Updated notes"
         
-        # Check deletion safety (should require confirmation due to high priority and XP)
+        # Check deletion safety (should require confirmation)
         safety_check = task_manager.check_deletion_safety(task.id)
         assert safety_check['requires_confirmation'] is True
         
-        # Delete task
-        result = task_manager.delete_task(task.id)
-        assert result['success'] is True
-        assert task.id not in task_manager._tasks
-    
-    def test_complete_then_edit_then_delete_workflow(self, task_manager):
-        """Test complete workflow with completed task restrictions."""
-        # Create and complete task
-        task = task_manager.create_task(
-            title="Task to complete",
-            difficulty=TaskDifficulty.MEDIUM,
-            priority=TaskPriority.HIGH
-        )
-        
-        completed_task, xp_earned = task_manager.complete_task(task.id)
-        assert completed_task.is_completed
-        assert xp_earned > 0
+        if complete_midway:
+            # Try to delete without force (should fail)
+            with pytest.raises(TaskStateError):
+                task_manager.delete_task(task.id)
         
-        # Try to edit difficulty (should fail)
-        with pytest.raises(TaskStateError):
-            task_manager.update_task(task.id, difficulty=TaskDifficulty.EASY)
-        
-        # Edit allowed fields (should succeed)
-        updated_task = task_manager.update_task(
-            task.id,
-            title="Updated completed task",
-            notes="Updated notes"
-        )
-        assert updated_task.title == "Updated completed task"
-        assert updated_task.notes == "Updated notes"
-        
-        # Try to delete without force (should fail)
-        with pytest.raises(TaskStateError):
-            task_manager.delete_task(task.id)
-        
-        # Delete with force (should succeed)
-        result = task_manager.delete_task(task.id, force=True)
+        # Delete task, forcing only when completed
+        result = task_manager.delete_task(task.id, force=complete_midway)
         assert result['success'] is True
         assert task.id not in task_manager._tasks
     
     def test_observer_notifications_for_edit_delete(self, task_manager):
         """Test that observers are notified of edit and delete operations."""
-        observer_calls = []
+        observer_calls: List[ObsCall] = []
         
         def test_observer(action, task):
-            observer_calls.append((action, task.id, task.title))
+            observer_calls.append(ObsCall(action, task.id, task.title))
         
         task_manager.add_observer(test_observer)
         
@@ -519,38 +372,39 @@ class TestTaskEditingDeletionIntegration:
         
         # Check observer was called for all actions
         assert len(observer_calls) == 3
-        assert observer_calls[0][0] == 'created'
-        assert observer_calls[1][0] == 'updated'
-        assert observer_calls[1][2] == 'Updated observer test task'  # Updated title
-        assert observer_calls[2][0] == 'deleted'
+        assert observer_calls[0].action == 'created'
+        assert observer_calls[1].action == 'updated'
+        assert observer_calls[1].title == 'Updated observer test task'  # Updated title
+        assert observer_calls[2].action == 'deleted'
+        assert {call.task_id for call in observer_calls} == {task.id}
     
-    def test_data_persistence_for_edit_delete(self, task_manager, mock_data_manager):
+    def test_data_persistence_for_edit_delete(self, recording_task_manager, recording_dm):
         """Test that edit and delete operations persist data."""
         # Create task
-        task = task_manager.create_task(
+        task = recording_task_manager.create_task(
             title="Persistence test task",
             difficulty=TaskDifficulty.EASY,
             priority=TaskPriority.LOW
         )
         
         # Reset mock call counts
-        mock_data_manager.save_tasks.reset_mock()
-        mock_data_manager.save_player_data.reset_mock()
+        recording_dm.save_tasks.reset_mock()
+        recording_dm.save_player_data.reset_mock()
         
         # Update task
-        task_manager.update_task(task.id, title="Updated persistence test")
+        recording_task_manager.update_task(task.id, title="Updated persistence test")
         
         # Verify save was called
-        mock_data_manager.save_tasks.assert_called()
-        mock_data_manager.save_player_data.assert_called()
+        recording_dm.save_tasks.assert_called()
+        recording_dm.save_player_data.assert_called()
         
         # Reset mock call counts
-        mock_data_manager.save_tasks.reset_mock()
-        mock_data_manager.save_player_data.reset_mock()
+        recording_dm.save_tasks.reset_mock()
+        recording_dm.save_player_data.reset_mock()
         
         # Delete task
-        task_manager.delete_task(task.id)
+        recording_task_manager.delete_task(task.id)
         
         # Verify save was called
-        mock_data_manager.save_tasks.assert_called()
-        mock_data_manager.save_player_data.assert_called()
\ No newline at end of file
+        recording_dm.save_tasks.assert_called()
+        recording_dm.save_player_data.assert_called()
\ No newline at end of file
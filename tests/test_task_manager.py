@@ -1,76 +1,74 @@
 """Unit tests for TaskManager with comprehensive CRUD and business logic scenarios."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime
-import uuid
+from unittest.mock import Mock
 
 from src.business.task_manager import (
     TaskManager, TaskManagerError, TaskNotFoundError, TaskStateError
 )
 from src.business.task_validator import TaskValidationError
-from src.data.data_manager import DataManager, DataPersistenceError
+from src.data.data_manager import DataPersistenceError
 from src.models.enums import TaskDifficulty, TaskPriority, TaskStatus
 from src.models.task import Task
 from src.models.player import PlayerData
+from tests.helpers import FIXED_DT
+
+# Task completion timestamps come from a frozen clock in every test here.
+pytestmark = pytest.mark.usefixtures("frozen_clock")
+
+
+def _seed(tm, *tasks):
+    """Store tasks directly in the manager's task dict."""
+    tm._tasks.update((task.id, task) for task in tasks)
 
 
 class TestTaskManager:
     """Test TaskManager CRUD operations and business logic."""
     
     @pytest.fixture
-    def mock_data_manager(self):
-        """Create mock DataManager for testing."""
-        mock_dm = Mock(spec=DataManager)
-        mock_dm.load_tasks.return_value = {}
-        mock_dm.load_player_data.return_value = PlayerData()
-        mock_dm.save_tasks.return_value = True
-        mock_dm.save_player_data.return_value = True
-        return mock_dm
-    
-    @pytest.fixture
-    def task_manager(self, mock_data_manager):
-        """Create TaskManager instance for testing."""
-        return TaskManager(mock_data_manager)
-    
-    @pytest.fixture
-    def sample_task(self):
-        """Create sample task for testing."""
-        return Task(
-            title="Test task",
-            difficulty=TaskDifficulty.MEDIUM,
-            priority=TaskPriority.HIGH,
-            notes="Test notes"
-        )
-    
-    def test_init_loads_data(self, mock_data_manager):
+    def mixed_status_tm(self, task_manager, task_factory):
+        """Create TaskManager holding tasks A (pending), B (completed) and C (active)."""
+        tasks = [
+            task_factory("A Task", TaskDifficulty.EASY, TaskPriority.LOW),
+            task_factory("B Task", TaskDifficulty.MEDIUM, TaskPriority.HIGH),
+            task_factory("C Task", TaskDifficulty.HARD, TaskPriority.CRITICAL),
+        ]
+        tasks[1].status = TaskStatus.COMPLETED
+        tasks[2].status = TaskStatus.ACTIVE
+        _seed(task_manager, *tasks)
+        return task_manager, tasks
+    
+    def test_init_loads_data(self, recording_dm):
         """Test TaskManager initialization loads data."""
         mock_tasks = {"task1": Mock()}
         mock_player = PlayerData(total_xp=100)
         
-        mock_data_manager.load_tasks.return_value = mock_tasks
-        mock_data_manager.load_player_data.return_value = mock_player
+        recording_dm.load_tasks.return_value = mock_tasks
+        recording_dm.load_player_data.side_effect = None
+        recording_dm.load_player_data.return_value = mock_player
         
-        tm = TaskManager(mock_data_manager)
+        tm = TaskManager(recording_dm)
         
         assert tm._tasks == mock_tasks
         assert tm._player_data.total_xp == 100
-        mock_data_manager.load_tasks.assert_called_once()
-        mock_data_manager.load_player_data.assert_called_once()
+        recording_dm.load_tasks.assert_called_once()
+        recording_dm.load_player_data.assert_called_once()
     
-    def test_init_handles_load_failure(self, mock_data_manager):
+    def test_init_handles_load_failure(self, recording_dm):
         """Test TaskManager initialization handles data load failures gracefully."""
-        mock_data_manager.load_tasks.side_effect = Exception("Load failed")
+        recording_dm.load_tasks.side_effect = Exception("Load failed")
         
-        tm = TaskManager(mock_data_manager)
+        tm = TaskManager(recording_dm)
         
         # Should continue with empty data
         assert tm._tasks == {}
         assert isinstance(tm._player_data, PlayerData)
     
-    def test_create_task_success(self, task_manager, mock_data_manager):
+    def test_create_task_success(self, recording_task_manager, recording_dm):
         """Test successful task creation."""
-        task = task_manager.create_task(
+        tm = recording_task_manager
+        
+        task = tm.create_task(
             title="New task",
             difficulty=TaskDifficulty.EASY,
             priority=TaskPriority.LOW,
@@ -82,10 +80,10 @@ class TestTaskManager:
         assert task.priority == TaskPriority.LOW
         assert task.notes == "Task notes"
         assert task.status == TaskStatus.PENDING
-        assert task.id in task_manager._tasks
+        assert task.id in tm._tasks
         
-        mock_data_manager.save_tasks.assert_called_once()
-        mock_data_manager.save_player_data.assert_called_once()
+        assert recording_dm.save_tasks.call_count == 1
+        assert recording_dm.save_player_data.call_count == 1
     
     def test_create_task_with_custom_id(self, task_manager):
         """Test task creation with custom ID."""
@@ -131,20 +129,20 @@ class TestTaskManager:
                 priority=TaskPriority.LOW
             )
     
-    def test_create_task_save_failure(self, task_manager, mock_data_manager):
+    def test_create_task_save_failure(self, recording_task_manager, recording_dm):
         """Test task creation handles save failures."""
-        mock_data_manager.save_tasks.side_effect = DataPersistenceError("Save failed")
+        recording_dm.save_tasks.side_effect = DataPersistenceError("Save failed")
         
         with pytest.raises(TaskManagerError, match="Failed to save data"):
-            task_manager.create_task(
+            recording_task_manager.create_task(
                 title="Test task",
                 difficulty=TaskDifficulty.EASY,
                 priority=TaskPriority.LOW
             )
     
-    def test_get_task_success(self, task_manager, sample_task):
+    def test_get_task_success(self, seeded_manager):
         """Test successful task retrieval."""
-        task_manager._tasks[sample_task.id] = sample_task
+        task_manager, sample_task = seeded_manager
         
         retrieved_task = task_manager.get_task(sample_task.id)
         assert retrieved_task == sample_task
@@ -154,64 +152,44 @@ class TestTaskManager:
         with pytest.raises(TaskNotFoundError, match="not found"):
             task_manager.get_task("non-existent-id")
     
-    def test_get_tasks_no_filter(self, task_manager):
+    def test_get_tasks_no_filter(self, mixed_status_tm):
         """Test getting all tasks without filters."""
-        task1 = Task("Task 1", TaskDifficulty.EASY, TaskPriority.LOW)
-        task2 = Task("Task 2", TaskDifficulty.HARD, TaskPriority.HIGH)
-        
-        task_manager._tasks[task1.id] = task1
-        task_manager._tasks[task2.id] = task2
+        task_manager, seeded_tasks = mixed_status_tm
         
         tasks = task_manager.get_tasks()
-        assert len(tasks) == 2
-        assert task1 in tasks
-        assert task2 in tasks
-    
-    def test_get_tasks_status_filter(self, task_manager):
-        """Test getting tasks with status filter."""
-        task1 = Task("Task 1", TaskDifficulty.EASY, TaskPriority.LOW)
-        task2 = Task("Task 2", TaskDifficulty.HARD, TaskPriority.HIGH)
+        assert len(tasks) == 3
+        assert {task.id for task in tasks} == {task.id for task in seeded_tasks}
+    
+    @pytest.mark.parametrize("filters,expected_titles", [
+        pytest.param(dict(status_filter=TaskStatus.PENDING), {"Task 1", "Task 3"}, id="pending"),
+        pytest.param(dict(status_filter=TaskStatus.COMPLETED), {"Task 2"}, id="completed"),
+        pytest.param(dict(status_filter=TaskStatus.ACTIVE), set(), id="active-none"),
+        pytest.param(
+            dict(difficulty_filter=TaskDifficulty.EASY, priority_filter=TaskPriority.LOW),
+            {"Task 1"}, id="easy-low"
+        ),
+        pytest.param(
+            dict(status_filter=TaskStatus.COMPLETED, difficulty_filter=TaskDifficulty.EASY),
+            set(), id="completed-easy-none"
+        ),
+    ])
+    def test_get_tasks_filters(self, task_manager, task_factory, filters, expected_titles):
+        """Test getting tasks with status, difficulty and priority filters."""
+        task1 = task_factory("Task 1", TaskDifficulty.EASY, TaskPriority.LOW)
+        task2 = task_factory("Task 2", TaskDifficulty.HARD, TaskPriority.HIGH)
         task2.status = TaskStatus.COMPLETED
+        task3 = task_factory("Task 3", TaskDifficulty.EASY, TaskPriority.HIGH)
         
-        task_manager._tasks[task1.id] = task1
-        task_manager._tasks[task2.id] = task2
-        
-        pending_tasks = task_manager.get_tasks(status_filter=TaskStatus.PENDING)
-        assert len(pending_tasks) == 1
-        assert task1 in pending_tasks
-        
-        completed_tasks = task_manager.get_tasks(status_filter=TaskStatus.COMPLETED)
-        assert len(completed_tasks) == 1
-        assert task2 in completed_tasks
-    
-    def test_get_tasks_multiple_filters(self, task_manager):
-        """Test getting tasks with multiple filters."""
-        task1 = Task("Task 1", TaskDifficulty.EASY, TaskPriority.LOW)
-        task2 = Task("Task 2", TaskDifficulty.EASY, TaskPriority.HIGH)
-        task3 = Task("Task 3", TaskDifficulty.HARD, TaskPriority.LOW)
-        
-        task_manager._tasks[task1.id] = task1
-        task_manager._tasks[task2.id] = task2
-        task_manager._tasks[task3.id] = task3
+        _seed(task_manager, task1, task2, task3)
         
-        filtered_tasks = task_manager.get_tasks(
-            difficulty_filter=TaskDifficulty.EASY,
-            priority_filter=TaskPriority.LOW
-        )
+        filtered_tasks = task_manager.get_tasks(**filters)
         
-        assert len(filtered_tasks) == 1
-        assert task1 in filtered_tasks
+        assert len(filtered_tasks) == len(expected_titles)
+        assert {task.title for task in filtered_tasks} == expected_titles
     
-    def test_get_tasks_sorting(self, task_manager):
+    def test_get_tasks_sorting(self, mixed_status_tm):
         """Test task sorting functionality."""
-        # Create tasks with different creation times
-        task1 = Task("A Task", TaskDifficulty.EASY, TaskPriority.LOW)
-        task2 = Task("B Task", TaskDifficulty.MEDIUM, TaskPriority.HIGH)
-        task3 = Task("C Task", TaskDifficulty.HARD, TaskPriority.CRITICAL)
-        
-        task_manager._tasks[task1.id] = task1
-        task_manager._tasks[task2.id] = task2
-        task_manager._tasks[task3.id] = task3
+        task_manager, _ = mixed_status_tm
         
         # Test title sorting
         tasks_by_title = task_manager.get_tasks(sort_by='title', reverse=False)
@@ -225,9 +203,9 @@ class TestTaskManager:
         assert tasks_by_difficulty[1].difficulty == TaskDifficulty.MEDIUM
         assert tasks_by_difficulty[2].difficulty == TaskDifficulty.HARD
     
-    def test_update_task_success(self, task_manager, sample_task):
+    def test_update_task_success(self, seeded_manager):
         """Test successful task update."""
-        task_manager._tasks[sample_task.id] = sample_task
+        task_manager, sample_task = seeded_manager
         
         updated_task = task_manager.update_task(
             sample_task.id,
@@ -244,29 +222,29 @@ class TestTaskManager:
         with pytest.raises(TaskNotFoundError):
             task_manager.update_task("non-existent", title="New title")
     
-    def test_update_task_validation_error(self, task_manager, sample_task):
+    def test_update_task_validation_error(self, seeded_manager):
         """Test task update with validation errors."""
-        task_manager._tasks[sample_task.id] = sample_task
+        task_manager, sample_task = seeded_manager
         
         with pytest.raises(TaskValidationError):
             task_manager.update_task(sample_task.id, title="")  # Empty title
     
-    def test_complete_task_success(self, task_manager, sample_task):
+    def test_complete_task_success(self, seeded_manager):
         """Test successful task completion."""
-        task_manager._tasks[sample_task.id] = sample_task
+        task_manager, sample_task = seeded_manager
         
         completed_task, xp_earned = task_manager.complete_task(sample_task.id)
         
         assert completed_task.is_completed
-        assert completed_task.completed_at is not None
+        assert completed_task.completed_at == FIXED_DT
         assert xp_earned > 0
         assert task_manager._player_data.tasks_completed == 1
         assert task_manager._player_data.total_xp == xp_earned
     
-    def test_complete_task_already_completed(self, task_manager, sample_task):
+    def test_complete_task_already_completed(self, seeded_manager):
         """Test completing already completed task."""
+        task_manager, sample_task = seeded_manager
         sample_task.status = TaskStatus.COMPLETED
-        task_manager._tasks[sample_task.id] = sample_task
         
         with pytest.raises(TaskStateError, match="already completed"):
             task_manager.complete_task(sample_task.id)
@@ -276,27 +254,27 @@ class TestTaskManager:
         with pytest.raises(TaskNotFoundError):
             task_manager.complete_task("non-existent")
     
-    def test_delete_task_success(self, task_manager, sample_task):
+    def test_delete_task_success(self, seeded_manager):
         """Test successful task deletion."""
-        task_manager._tasks[sample_task.id] = sample_task
+        task_manager, sample_task = seeded_manager
         
         result = task_manager.delete_task(sample_task.id)
         
         assert result['success'] is True
         assert sample_task.id not in task_manager._tasks
     
-    def test_delete_completed_task_without_force(self, task_manager, sample_task):
+    def test_delete_completed_task_without_force(self, seeded_manager):
         """Test deleting completed task without force flag."""
+        task_manager, sample_task = seeded_manager
         sample_task.status = TaskStatus.COMPLETED
-        task_manager._tasks[sample_task.id] = sample_task
         
         with pytest.raises(TaskStateError, match="without confirmation"):
             task_manager.delete_task(sample_task.id)
     
-    def test_delete_completed_task_with_force(self, task_manager, sample_task):
+    def test_delete_completed_task_with_force(self, seeded_manager):
         """Test deleting completed task with force flag."""
+        task_manager, sample_task = seeded_manager
         sample_task.status = TaskStatus.COMPLETED
-        task_manager._tasks[sample_task.id] = sample_task
         
         result = task_manager.delete_task(sample_task.id, force=True)
         
@@ -308,17 +286,9 @@ class TestTaskManager:
         with pytest.raises(TaskNotFoundError):
             task_manager.delete_task("non-existent")
     
-    def test_get_task_count(self, task_manager):
+    def test_get_task_count(self, mixed_status_tm):
         """Test task count statistics."""
-        task1 = Task("Task 1", TaskDifficulty.EASY, TaskPriority.LOW)
-        task2 = Task("Task 2", TaskDifficulty.MEDIUM, TaskPriority.HIGH)
-        task2.status = TaskStatus.COMPLETED
-        task3 = Task("Task 3", TaskDifficulty.HARD, TaskPriority.CRITICAL)
-        task3.status = TaskStatus.ACTIVE
-        
-        task_manager._tasks[task1.id] = task1
-        task_manager._tasks[task2.id] = task2
-        task_manager._tasks[task3.id] = task3
+        task_manager, _ = mixed_status_tm
         
         counts = task_manager.get_task_count()
         
@@ -338,9 +308,9 @@ class TestTaskManager:
         assert player_data.total_xp == 150
         assert player_data.tasks_completed == 5
     
-    def test_preview_task_xp(self, task_manager, sample_task):
+    def test_preview_task_xp(self, seeded_manager):
         """Test XP preview for task completion."""
-        task_manager._tasks[sample_task.id] = sample_task
+        task_manager, sample_task = seeded_manager
         
         preview = task_manager.preview_task_xp(sample_task.id)
         
@@ -349,15 +319,13 @@ class TestTaskManager:
         assert 'breakdown' in preview
         assert preview['base_xp'] == sample_task.difficulty.xp_value
     
-    def test_bulk_update_status(self, task_manager):
+    def test_bulk_update_status(self, task_manager, task_factory):
         """Test bulk status update."""
-        task1 = Task("Task 1", TaskDifficulty.EASY, TaskPriority.LOW)
-        task2 = Task("Task 2", TaskDifficulty.MEDIUM, TaskPriority.HIGH)
-        task3 = Task("Task 3", TaskDifficulty.HARD, TaskPriority.CRITICAL)
+        task1 = task_factory("Task 1", TaskDifficulty.EASY, TaskPriority.LOW)
+        task2 = task_factory("Task 2", TaskDifficulty.MEDIUM, TaskPriority.HIGH)
+        task3 = task_factory("Task 3", TaskDifficulty.HARD, TaskPriority.CRITICAL)
         
-        task_manager._tasks[task1.id] = task1
-        task_manager._tasks[task2.id] = task2
-        task_manager._tasks[task3.id] = task3
+        _seed(task_manager, task1, task2, task3)
         
         task_ids = [task1.id, task2.id, task3.id]
         updated_tasks = task_manager.bulk_update_status(task_ids, TaskStatus.ACTIVE)
@@ -366,14 +334,13 @@ class TestTaskManager:
         for task in updated_tasks:
             assert task.status == TaskStatus.ACTIVE
     
-    def test_bulk_update_status_partial_failure(self, task_manager):
+    def test_bulk_update_status_partial_failure(self, task_manager, task_factory):
         """Test bulk status update with some failures."""
-        task1 = Task("Task 1", TaskDifficulty.EASY, TaskPriority.LOW)
-        task2 = Task("Task 2", TaskDifficulty.MEDIUM, TaskPriority.HIGH)
+        task1 = task_factory("Task 1", TaskDifficulty.EASY, TaskPriority.LOW)
+        task2 = task_factory("Task 2", TaskDifficulty.MEDIUM, TaskPriority.HIGH)
         task2.status = TaskStatus.COMPLETED  # Cannot transition from completed
         
-        task_manager._tasks[task1.id] = task1
-        task_manager._tasks[task2.id] = task2
+        _seed(task_manager, task1, task2)
         
         task_ids = [task1.id, task2.id, "non-existent"]
         updated_tasks = task_manager.bulk_update_status(task_ids, TaskStatus.ACTIVE)
@@ -383,27 +350,25 @@ class TestTaskManager:
         assert updated_tasks[0].id == task1.id
         assert updated_tasks[0].status == TaskStatus.ACTIVE
     
-    def test_search_tasks(self, task_manager):
+    def test_search_tasks(self, task_manager, task_factory):
         """Test task search functionality."""
-        task1 = Task("Implement authentication", TaskDifficulty.EASY, TaskPriority.LOW)
-        task1.notes = "JWT tokens"
-        task2 = Task("Fix bug in login", TaskDifficulty.MEDIUM, TaskPriority.HIGH)
-        task2.notes = "Password validation"
-        task3 = Task("Add user dashboard", TaskDifficulty.HARD, TaskPriority.CRITICAL)
+        task1 = task_factory("Implement authentication", TaskDifficulty.EASY, TaskPriority.LOW,
+                             notes="JWT tokens")
+        task2 = task_factory("Fix bug in login", TaskDifficulty.MEDIUM, TaskPriority.HIGH,
+                             notes="Password validation")
+        task3 = task_factory("Add user dashboard", TaskDifficulty.HARD, TaskPriority.CRITICAL)
         
-        task_manager._tasks[task1.id] = task1
-        task_manager._tasks[task2.id] = task2
-        task_manager._tasks[task3.id] = task3
+        _seed(task_manager, task1, task2, task3)
         
         # Search by title
         results = task_manager.search_tasks("authentication")
         assert len(results) == 1
-        assert task1 in results
+        assert {task.id for task in results} == {task1.id}
         
         # Search by notes
         results = task_manager.search_tasks("password")
         assert len(results) == 1
-        assert task2 in results
+        assert {task.id for task in results} == {task2.id}
         
         # Search with no matches
         results = task_manager.search_tasks("nonexistent")
@@ -413,46 +378,56 @@ class TestTaskManager:
         results = task_manager.search_tasks("")
         assert len(results) == 0
     
-    def test_observer_pattern(self, task_manager):
-        """Test observer pattern for task changes."""
+    @pytest.mark.parametrize("followup_steps", [
+        pytest.param(0, id="created"),
+        pytest.param(1, id="updated"),
+        pytest.param(2, id="completed"),
+        pytest.param(3, id="deleted"),
+    ])
+    def test_observer_pattern(self, task_manager, followup_steps):
+        """Test observer is notified of each task change in order."""
         observer_calls = []
+        task_manager.add_observer(lambda action, task: observer_calls.append((action, task.id)))
         
-        def test_observer(action, task):
-            observer_calls.append((action, task.id))
-        
-        task_manager.add_observer(test_observer)
-        
-        # Create task
         task = task_manager.create_task(
             "Test task", TaskDifficulty.EASY, TaskPriority.LOW
         )
+        if followup_steps >= 1:
+            task_manager.update_task(task.id, title="Updated task")
+        if followup_steps >= 2:
+            task_manager.complete_task(task.id)
+        if followup_steps >= 3:
+            task_manager.delete_task(task.id, force=True)
+        
+        expected = [
+            ('created', task.id),
+            ('updated', task.id),
+            ('completed', task.id),
+            ('deleted', task.id),
+        ]
+        assert observer_calls == expected[:followup_steps + 1]
+    
+    def test_remove_observer(self, task_manager):
+        """Test removed observers are no longer notified."""
+        observer_calls = []
+        recorder = lambda action, task: observer_calls.append((action, task.id))
         
-        # Update task
-        task_manager.update_task(task.id, title="Updated task")
-        
-        # Complete task
-        task_manager.complete_task(task.id)
-        
-        # Delete task
-        task_manager.delete_task(task.id, force=True)
-        
-        # Check observer was called for all actions
-        assert len(observer_calls) == 4
-        assert observer_calls[0] == ('created', task.id)
-        assert observer_calls[1] == ('updated', task.id)
-        assert observer_calls[2] == ('completed', task.id)
-        assert observer_calls[3] == ('deleted', task.id)
+        task_manager.add_observer(recorder)
+        task = task_manager.create_task(
+            "Test task", TaskDifficulty.EASY, TaskPriority.LOW
+        )
+        assert observer_calls == [('created', task.id)]
         
         # Remove observer
-        task_manager.remove_observer(test_observer)
+        task_manager.remove_observer(recorder)
         
         # Create another task - observer should not be called
-        task2 = task_manager.create_task(
+        task_manager.create_task(
             "Another task", TaskDifficulty.MEDIUM, TaskPriority.HIGH
         )
         
         # Observer calls should remain the same
-        assert len(observer_calls) == 4
+        assert len(observer_calls) == 1
     
     def test_observer_exception_handling(self, task_manager):
         """Test that observer exceptions don't break task operations."""
@@ -1,159 +1,170 @@
 """Unit tests for TaskValidator with comprehensive validation scenarios."""
 
+import re
 import pytest
-from datetime import datetime
 
 from src.business.task_validator import TaskValidator, TaskValidationError
 from src.models.enums import TaskDifficulty, TaskPriority, TaskStatus
+from tests.helpers import FIXED_DT
+
+_DIFFICULTIES = tuple(TaskDifficulty)
+_PRIORITIES = tuple(TaskPriority)
+_STATUSES = tuple(TaskStatus)
+
+_MAX_TITLE = "A" * TaskValidator.MAX_TITLE_LENGTH
+_OVERFLOW_TITLE = _MAX_TITLE + "A"
+_MAX_NOTES = "A" * TaskValidator.MAX_NOTES_LENGTH
+_OVERFLOW_NOTES = _MAX_NOTES + "A"
+
+# (field, bad value, expected validation error fragment)
+_BAD_ENUM_CASES = (
+    ("difficulty", "INVALID", "Invalid difficulty: INVALID"),
+    ("priority", "WRONG", "Invalid priority: WRONG"),
+    ("status", "BADSTATUS", "Invalid status: BADSTATUS"),
+)
+_BAD_FIELD_CASES = _BAD_ENUM_CASES + (
+    ("created_at", "invalid-timestamp", "Invalid created_at timestamp format"),
+    ("completed_at", "also-invalid", "Invalid completed_at timestamp format"),
+)
+
+_EMPTY_TITLE_RE = re.compile("Title cannot be empty")
+_TITLE_TOO_LONG_RE = re.compile("cannot exceed 200 characters")
+_TITLE_TYPE_RE = re.compile("Title must be a string")
+_TITLE_SPECIAL_START_RE = re.compile("cannot start with special characters")
+_DIFFICULTY_TYPE_RE = re.compile("must be a TaskDifficulty enum")
+_PRIORITY_TYPE_RE = re.compile("must be a TaskPriority enum")
+_STATUS_TYPE_RE = re.compile("must be a TaskStatus enum")
+_NOTES_TOO_LONG_RE = re.compile("cannot exceed 1000 characters")
+_NOTES_TYPE_RE = re.compile("Notes must be a string or None")
+_TRANSITION_RE = re.compile("Cannot transition from")
+_TRANSITION_TYPE_RE = re.compile("must be TaskStatus enum values")
 
 
 class TestTaskValidator:
     """Test TaskValidator validation methods."""
     
-    def test_validate_title_success(self):
+    @pytest.mark.parametrize("title", [
+        "Valid task title",
+        "Task with numbers 123",
+        pytest.param(_MAX_TITLE, id="max_length"),
+        "Task-with-dashes",
+        "Task_with_underscores",
+    ])
+    def test_validate_title_success(self, title):
         """Test successful title validation."""
-        valid_titles = [
-            "Valid task title",
-            "Task with numbers 123",
-            "A" * 200,  # Max length
-            "Task-with-dashes",
-            "Task_with_underscores"
-        ]
-        
-        for title in valid_titles:
-            assert TaskValidator.validate_title(title) is True
+        assert TaskValidator.validate_title(title) is True
     
-    def test_validate_title_empty(self):
+    @pytest.mark.parametrize("title", [
+        pytest.param("", id="empty"),
+        pytest.param("   ", id="spaces"),
+        pytest.param("\t\n", id="tab_newline"),
+    ])
+    def test_validate_title_empty(self, title):
         """Test title validation with empty strings."""
-        invalid_titles = ["", "   ", "\t\n"]
-        
-        for title in invalid_titles:
-            with pytest.raises(TaskValidationError, match="Title cannot be empty"):
-                TaskValidator.validate_title(title)
+        with pytest.raises(TaskValidationError, match=_EMPTY_TITLE_RE):
+            TaskValidator.validate_title(title)
     
     def test_validate_title_too_long(self):
         """Test title validation with excessive length."""
-        long_title = "A" * 201
-        
-        with pytest.raises(TaskValidationError, match="cannot exceed 200 characters"):
-            TaskValidator.validate_title(long_title)
+        with pytest.raises(TaskValidationError, match=_TITLE_TOO_LONG_RE):
+            TaskValidator.validate_title(_OVERFLOW_TITLE)
     
-    def test_validate_title_invalid_type(self):
+    @pytest.mark.parametrize("invalid_title", [123, None, [], {}])
+    def test_validate_title_invalid_type(self, invalid_title):
         """Test title validation with non-string types."""
-        invalid_types = [123, None, [], {}]
-        
-        for invalid_title in invalid_types:
-            with pytest.raises(TaskValidationError, match="Title must be a string"):
-                TaskValidator.validate_title(invalid_title)
+        with pytest.raises(TaskValidationError, match=_TITLE_TYPE_RE):
+            TaskValidator.validate_title(invalid_title)
     
-    def test_validate_title_special_characters_start(self):
+    @pytest.mark.parametrize("title", ["@invalid", "#invalid", "!invalid"])
+    def test_validate_title_special_characters_start(self, title):
         """Test title validation with special characters at start."""
-        invalid_titles = ["@invalid", "#invalid", "!invalid"]
-        
-        for title in invalid_titles:
-            with pytest.raises(TaskValidationError, match="cannot start with special characters"):
-                TaskValidator.validate_title(title)
+        with pytest.raises(TaskValidationError, match=_TITLE_SPECIAL_START_RE):
+            TaskValidator.validate_title(title)
     
-    def test_validate_difficulty_success(self):
+    @pytest.mark.parametrize("difficulty", _DIFFICULTIES)
+    def test_validate_difficulty_success(self, difficulty):
         """Test successful difficulty validation."""
-        for difficulty in TaskDifficulty:
-            assert TaskValidator.validate_difficulty(difficulty) is True
+        assert TaskValidator.validate_difficulty(difficulty) is True
     
-    def test_validate_difficulty_invalid_type(self):
+    @pytest.mark.parametrize("difficulty", ["Easy", 1, None, []])
+    def test_validate_difficulty_invalid_type(self, difficulty):
         """Test difficulty validation with invalid types."""
-        invalid_difficulties = ["Easy", 1, None, []]
-        
-        for difficulty in invalid_difficulties:
-            with pytest.raises(TaskValidationError, match="must be a TaskDifficulty enum"):
-                TaskValidator.validate_difficulty(difficulty)
+        with pytest.raises(TaskValidationError, match=_DIFFICULTY_TYPE_RE):
+            TaskValidator.validate_difficulty(difficulty)
     
-    def test_validate_priority_success(self):
+    @pytest.mark.parametrize("priority", _PRIORITIES)
+    def test_validate_priority_success(self, priority):
         """Test successful priority validation."""
-        for priority in TaskPriority:
-            assert TaskValidator.validate_priority(priority) is True
+        assert TaskValidator.validate_priority(priority) is True
     
-    def test_validate_priority_invalid_type(self):
+    @pytest.mark.parametrize("priority", ["High", 1, None, []])
+    def test_validate_priority_invalid_type(self, priority):
         """Test priority validation with invalid types."""
-        invalid_priorities = ["High", 1, None, []]
-        
-        for priority in invalid_priorities:
-            with pytest.raises(TaskValidationError, match="must be a TaskPriority enum"):
-                TaskValidator.validate_priority(priority)
+        with pytest.raises(TaskValidationError, match=_PRIORITY_TYPE_RE):
+            TaskValidator.validate_priority(priority)
     
-    def test_validate_status_success(self):
+    @pytest.mark.parametrize("status", _STATUSES)
+    def test_validate_status_success(self, status):
         """Test successful status validation."""
-        for status in TaskStatus:
-            assert TaskValidator.validate_status(status) is True
+        assert TaskValidator.validate_status(status) is True
     
-    def test_validate_status_invalid_type(self):
+    @pytest.mark.parametrize("status", ["Pending", 1, None, []])
+    def test_validate_status_invalid_type(self, status):
         """Test status validation with invalid types."""
-        invalid_statuses = ["Pending", 1, None, []]
-        
-        for status in invalid_statuses:
-            with pytest.raises(TaskValidationError, match="must be a TaskStatus enum"):
-                TaskValidator.validate_status(status)
+        with pytest.raises(TaskValidationError, match=_STATUS_TYPE_RE):
+            TaskValidator.validate_status(status)
     
-    def test_validate_notes_success(self):
+    @pytest.mark.parametrize("notes", [
+        None,
+        pytest.param("", id="empty"),
+        "Valid notes",
+        pytest.param(_MAX_NOTES, id="max_length"),
+        pytest.param("Notes with\nnewlines", id="newlines"),
+    ])
+    def test_validate_notes_success(self, notes):
         """Test successful notes validation."""
-        valid_notes = [
-            None,
-            "",
-            "Valid notes",
-            "A" * 1000,  # Max length
-            "Notes with\nnewlines"
-        ]
-        
-        for notes in valid_notes:
-            assert TaskValidator.validate_notes(notes) is True
+        assert TaskValidator.validate_notes(notes) is True
     
     def test_validate_notes_too_long(self):
         """Test notes validation with excessive length."""
-        long_notes = "A" * 1001
-        
-        with pytest.raises(TaskValidationError, match="cannot exceed 1000 characters"):
-            TaskValidator.validate_notes(long_notes)
+        with pytest.raises(TaskValidationError, match=_NOTES_TOO_LONG_RE):
+            TaskValidator.validate_notes(_OVERFLOW_NOTES)
     
-    def test_validate_notes_invalid_type(self):
+    @pytest.mark.parametrize("notes", [123, [], {}])
+    def test_validate_notes_invalid_type(self, notes):
         """Test notes validation with invalid types."""
-        invalid_notes = [123, [], {}]
-        
-        for notes in invalid_notes:
-            with pytest.raises(TaskValidationError, match="Notes must be a string or None"):
-                TaskValidator.validate_notes(notes)
+        with pytest.raises(TaskValidationError, match=_NOTES_TYPE_RE):
+            TaskValidator.validate_notes(notes)
     
-    def test_validate_status_transition_success(self):
+    @pytest.mark.parametrize("current,new", [
+        (TaskStatus.PENDING, TaskStatus.ACTIVE),
+        (TaskStatus.PENDING, TaskStatus.BLOCKED),
+        (TaskStatus.PENDING, TaskStatus.COMPLETED),
+        (TaskStatus.ACTIVE, TaskStatus.PENDING),
+        (TaskStatus.ACTIVE, TaskStatus.BLOCKED),
+        (TaskStatus.ACTIVE, TaskStatus.COMPLETED),
+        (TaskStatus.BLOCKED, TaskStatus.PENDING),
+        (TaskStatus.BLOCKED, TaskStatus.ACTIVE),
+        (TaskStatus.BLOCKED, TaskStatus.COMPLETED),
+    ])
+    def test_validate_status_transition_success(self, current, new):
         """Test successful status transitions."""
-        valid_transitions = [
-            (TaskStatus.PENDING, TaskStatus.ACTIVE),
-            (TaskStatus.PENDING, TaskStatus.BLOCKED),
-            (TaskStatus.PENDING, TaskStatus.COMPLETED),
-            (TaskStatus.ACTIVE, TaskStatus.PENDING),
-            (TaskStatus.ACTIVE, TaskStatus.BLOCKED),
-            (TaskStatus.ACTIVE, TaskStatus.COMPLETED),
-            (TaskStatus.BLOCKED, TaskStatus.PENDING),
-            (TaskStatus.BLOCKED, TaskStatus.ACTIVE),
-            (TaskStatus.BLOCKED, TaskStatus.COMPLETED)
-        ]
-        
-        for current, new in valid_transitions:
-            assert TaskValidator.validate_status_transition(current, new) is True
+        assert TaskValidator.validate_status_transition(current, new) is True
     
-    def test_validate_status_transition_invalid(self):
+    # Completed tasks cannot transition to other states
+    @pytest.mark.parametrize("current,new", [
+        (TaskStatus.COMPLETED, TaskStatus.PENDING),
+        (TaskStatus.COMPLETED, TaskStatus.ACTIVE),
+        (TaskStatus.COMPLETED, TaskStatus.BLOCKED),
+    ])
+    def test_validate_status_transition_invalid(self, current, new):
         """Test invalid status transitions."""
-        # Completed tasks cannot transition to other states
-        invalid_transitions = [
-            (TaskStatus.COMPLETED, TaskStatus.PENDING),
-            (TaskStatus.COMPLETED, TaskStatus.ACTIVE),
-            (TaskStatus.COMPLETED, TaskStatus.BLOCKED)
-        ]
-        
-        for current, new in invalid_transitions:
-            with pytest.raises(TaskValidationError, match="Cannot transition from"):
-                TaskValidator.validate_status_transition(current, new)
+        with pytest.raises(TaskValidationError, match=_TRANSITION_RE):
+            TaskValidator.validate_status_transition(current, new)
     
     def test_validate_status_transition_invalid_types(self):
         """Test status transition validation with invalid types."""
-        with pytest.raises(TaskValidationError, match="must be TaskStatus enum values"):
+        with pytest.raises(TaskValidationError, match=_TRANSITION_TYPE_RE):
             TaskValidator.validate_status_transition("PENDING", TaskStatus.ACTIVE)
     
     def test_validate_task_data_success(self):
@@ -197,102 +208,60 @@ class TestTaskValidator:
         assert data_with_strings['priority'] == TaskPriority.HIGH
         assert data_with_strings['status'] == TaskStatus.PENDING
     
-    def test_validate_task_data_invalid_string_enums(self):
-        """Test task data validation with invalid string enum values."""
-        data_with_invalid_strings = {
-            'title': 'Valid task',
-            'difficulty': 'INVALID',
-            'priority': 'WRONG',
-            'status': 'BADSTATUS'
-        }
-        
-        errors = TaskValidator.validate_task_data(data_with_invalid_strings)
-        assert len(errors) == 3
-        assert any("Invalid difficulty: INVALID" in error for error in errors)
-        assert any("Invalid priority: WRONG" in error for error in errors)
-        assert any("Invalid status: BADSTATUS" in error for error in errors)
-    
-    def test_validate_task_data_invalid_timestamps(self):
-        """Test task data validation with invalid timestamps."""
-        data_with_bad_timestamps = {
+    @pytest.mark.parametrize("field,bad_value,error_fragment", _BAD_FIELD_CASES)
+    def test_validate_task_data_invalid_field(self, field, bad_value, error_fragment):
+        """Test task data validation with an invalid enum string or timestamp."""
+        data = {
             'title': 'Valid task',
             'difficulty': TaskDifficulty.EASY,
             'priority': TaskPriority.LOW,
-            'created_at': 'invalid-timestamp',
-            'completed_at': 'also-invalid'
-        }
-        
-        errors = TaskValidator.validate_task_data(data_with_bad_timestamps)
-        assert len(errors) == 2
-        assert any("Invalid created_at timestamp format" in error for error in errors)
-        assert any("Invalid completed_at timestamp format" in error for error in errors)
-    
-    def test_validate_task_update_success(self):
-        """Test successful task update validation."""
-        current_data = {
-            'id': 'task-1',
-            'title': 'Current task',
-            'difficulty': TaskDifficulty.EASY,
-            'priority': TaskPriority.LOW,
-            'status': TaskStatus.PENDING,
-            'created_at': datetime.now()
-        }
-        
-        update_data = {
-            'title': 'Updated task',
-            'priority': TaskPriority.HIGH
-        }
-        
-        errors = TaskValidator.validate_task_update(current_data, update_data)
-        assert errors == []
-    
-    def test_validate_task_update_immutable_fields(self):
-        """Test task update validation with immutable fields."""
-        current_data = {
-            'id': 'task-1',
-            'status': TaskStatus.PENDING
-        }
-        
-        update_data = {
-            'id': 'new-id',
-            'created_at': datetime.now()
-        }
-        
-        errors = TaskValidator.validate_task_update(current_data, update_data)
-        assert len(errors) == 2
-        assert any("Cannot update immutable field: id" in error for error in errors)
-        assert any("Cannot update immutable field: created_at" in error for error in errors)
-    
-    def test_validate_task_update_completed_task_restrictions(self):
-        """Test task update validation for completed tasks."""
-        current_data = {
-            'status': TaskStatus.COMPLETED,
-            'difficulty': TaskDifficulty.EASY
-        }
-        
-        update_data = {
-            'difficulty': TaskDifficulty.HARD,
-            'xp_reward': 50
-        }
-        
-        errors = TaskValidator.validate_task_update(current_data, update_data)
-        assert len(errors) == 2
-        assert any("Cannot update difficulty for completed task" in error for error in errors)
-        assert any("Cannot update xp_reward for completed task" in error for error in errors)
-    
-    def test_validate_task_update_invalid_status_transition(self):
-        """Test task update validation with invalid status transition."""
-        current_data = {
-            'status': TaskStatus.COMPLETED
+            field: bad_value
         }
         
-        update_data = {
-            'status': TaskStatus.PENDING
-        }
-        
-        errors = TaskValidator.validate_task_update(current_data, update_data)
+        errors = TaskValidator.validate_task_data(data)
         assert len(errors) == 1
-        assert "Cannot transition from" in errors[0]
+        assert error_fragment in errors[0]
+    
+    @pytest.mark.parametrize("current,update,expected_substrings", [
+        pytest.param(
+            {
+                'id': 'task-1',
+                'title': 'Current task',
+                'difficulty': TaskDifficulty.EASY,
+                'priority': TaskPriority.LOW,
+                'status': TaskStatus.PENDING,
+                'created_at': FIXED_DT
+            },
+            {'title': 'Updated task', 'priority': TaskPriority.HIGH},
+            [],
+            id="success"
+        ),
+        pytest.param(
+            {'id': 'task-1', 'status': TaskStatus.PENDING},
+            {'id': 'new-id', 'created_at': FIXED_DT},
+            ["Cannot update immutable field: id", "Cannot update immutable field: created_at"],
+            id="immutable_fields"
+        ),
+        pytest.param(
+            {'status': TaskStatus.COMPLETED, 'difficulty': TaskDifficulty.EASY},
+            {'difficulty': TaskDifficulty.HARD, 'xp_reward': 50},
+            ["Cannot update difficulty for completed task", "Cannot update xp_reward for completed task"],
+            id="completed_task_restrictions"
+        ),
+        pytest.param(
+            {'status': TaskStatus.COMPLETED},
+            {'status': TaskStatus.PENDING},
+            ["Cannot transition from"],
+            id="invalid_status_transition"
+        ),
+    ])
+    def test_validate_task_update(self, current, update, expected_substrings):
+        """Test task update validation errors for each update scenario."""
+        errors = TaskValidator.validate_task_update(dict(current), dict(update))
+        
+        assert len(errors) == len(expected_substrings)
+        for substring in expected_substrings:
+            assert any(substring in error for error in errors), substring
     
     def test_sanitize_task_data_success(self):
         """Test task data sanitization."""
@@ -322,16 +291,12 @@ class TestTaskValidator:
         sanitized = TaskValidator.sanitize_task_data(data)
         assert sanitized['notes'] is None
     
-    def test_sanitize_task_data_invalid_enum_strings(self):
+    @pytest.mark.parametrize("field,bad_value", [case[:2] for case in _BAD_ENUM_CASES])
+    def test_sanitize_task_data_invalid_enum_strings(self, field, bad_value):
         """Test task data sanitization with invalid enum strings."""
-        data = {
-            'title': 'Valid title',
-            'difficulty': 'INVALID',
-            'priority': 'WRONG'
-        }
+        data = {'title': 'Valid title', field: bad_value}
         
         sanitized = TaskValidator.sanitize_task_data(data)
         
         # Invalid enum strings should remain as strings for validation to catch
-        assert sanitized['difficulty'] == 'INVALID'
-        assert sanitized['priority'] == 'WRONG'
\ No newline at end of file
+        assert sanitized[field] == bad_value